@@ -13,24 +13,35 @@ Usage (direct uvicorn):
 
 from __future__ import annotations
 
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response, status
+from fastapi.responses import JSONResponse
 
-from backend.controllers.allocation_controller import router as prediction_router
-from backend.controllers.dashboard_controller import router as dashboard_router
-from backend.repository.data_repository import DataRepository
-from backend.services.auth_service import AuthService
-from backend.services.dashboard_service import DashboardWorkflowService
-from backend.services.matching_service import AllocationOptimizationService
-from backend.services.prediction_service import AvailabilityPredictionService
-from backend.services.simulation_service import SimulationService
 from backend.utils.config import get_settings
-from backend.utils.logger import get_logger
+from backend.utils.logger import configure_logging, get_logger
+from backend.utils.responses import ORJSONResponse
+
+if TYPE_CHECKING:
+    from backend.repository.data_repository import DataRepository
+    from backend.services.prediction_service import AvailabilityPredictionService
 
 
 logger = get_logger(__name__)
 
+# Paths that must stay reachable while startup initialization is still running.
+_READINESS_EXEMPT_PATHS = frozenset({"/", "/dashboard", "/health/live", "/health/ready"})
+
+# Guard against duplicate initialization when the module is imported twice
+# (uvicorn --reload, tests importing `app`) or the lifespan re-fires; model
+# training is the expensive piece and must run at most once per process.
+_STARTUP_LOCK = threading.Lock()
+_STARTUP_COMPLETED = False
+
 
 def create_app() -> FastAPI:
     """
@@ -38,7 +49,26 @@ def create_app() -> FastAPI:
 
     Instantiates all services with explicit dependency injection via app.state.
     No global singletons — every dependency is traceable from this function.
+
+    Service and controller modules are imported here rather than at module
+    scope: they transitively pull in sklearn, pandas, and OR-Tools, which
+    dominate `import app` time when the application object is never built.
     """
+    from backend.controllers import root_router
+    from backend.controllers.allocation_controller import (
+        get_matching_service,
+        get_prediction_service,
+    )
+    from backend.controllers.dependencies import get_auth_service, get_dashboard_service
+    from backend.controllers.error_handlers import register_exception_handlers
+    from backend.repository.data_repository import DataRepository
+    from backend.services.auth_service import AuthService
+    from backend.services.dashboard_service import DashboardWorkflowService
+    from backend.services.matching_service import AllocationOptimizationService
+    from backend.services.prediction_service import AvailabilityPredictionService
+    from backend.services.simulation_service import SimulationService
+
+    configure_logging()
     settings = get_settings()
 
     # --- Repository (single SQLite connection factory) ---
@@ -68,21 +98,94 @@ def create_app() -> FastAPI:
         settings=settings,
     )
 
+    async def _run_startup(app: FastAPI) -> None:
+        """Run the blocking startup sequence off the event loop, then flip readiness."""
+        try:
+            await asyncio.to_thread(_startup, app)
+        except Exception:
+            logger.exception("Startup initialization failed; service stays not-ready")
+            return
+        app.state.ready_event.set()
+
     @asynccontextmanager
     async def lifespan(app: FastAPI):
-        """Run startup initialization before accepting requests."""
-        _startup(app)
+        """Bind the socket immediately; heavy init runs in a background task.
+
+        Cloud health checks hit `/` within seconds of process start, so seeding
+        and model training must not delay socket accept. Endpoints that need the
+        trained model are gated by the readiness middleware below until the
+        background task completes.
+        """
+        app.state.ready_event = asyncio.Event()
+        startup_task = asyncio.create_task(_run_startup(app))
         yield
+        if not startup_task.done():
+            startup_task.cancel()
+        # Queued background writes (if async persistence is enabled) must
+        # land before the pool closes underneath the writer thread.
+        matching_service.flush_pending_persists()
+        # Drain pooled connections with PRAGMA optimize so planner statistics
+        # are persisted for the next process start.
+        repository.close()
 
     app = FastAPI(
         title=settings.app_name,
         version=settings.app_version,
         lifespan=lifespan,
+        # orjson serializes the list-heavy /predict and /allocate payloads in C
+        # rather than through stdlib json.dumps; the repo-local class also
+        # accepts NumPy scalars and non-str keys directly.
+        default_response_class=ORJSONResponse,
+        # The dashboard SPA is the primary client; production deployments can
+        # set ENABLE_OPENAPI=0 to skip building the schema tree entirely.
+        openapi_url="/openapi.json" if settings.enable_openapi else None,
+        docs_url="/docs" if settings.enable_openapi else None,
+        redoc_url="/redoc" if settings.enable_openapi else None,
     )
 
+    @app.middleware("http")
+    async def readiness_gate(request: Request, call_next) -> Response:
+        """Hold non-exempt requests until startup init completes (503 on timeout)."""
+        ready_event: asyncio.Event | None = getattr(app.state, "ready_event", None)
+        if (
+            ready_event is None
+            or ready_event.is_set()
+            or request.url.path in _READINESS_EXEMPT_PATHS
+        ):
+            return await call_next(request)
+        try:
+            await asyncio.wait_for(ready_event.wait(), timeout=settings.startup_timeout)
+        except asyncio.TimeoutError:
+            return JSONResponse(
+                {"detail": "starting"},
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
+        return await call_next(request)
+
+    @app.get("/health/live", include_in_schema=False)
+    async def health_live() -> dict[str, str]:
+        """Liveness probe — always 200 while the process is serving."""
+        return {"status": "alive"}
+
+    @app.get("/health/ready", include_in_schema=False)
+    async def health_ready() -> Response:
+        """Readiness probe — 200 only once startup initialization finished."""
+        ready_event: asyncio.Event | None = getattr(app.state, "ready_event", None)
+        if ready_event is not None and ready_event.is_set():
+            return JSONResponse({"status": "ready"})
+        return JSONResponse(
+            {"status": "starting"},
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
+
     # --- Routers ---
-    app.include_router(prediction_router)
-    app.include_router(dashboard_router)
+    # backend.controllers merges both controller routers at import time, so
+    # the app-level include_router (which rebuilds the dependant graph per
+    # route) runs exactly once.
+    app.include_router(root_router)
+
+    # Domain-exception -> HTTP status mapping, shared by every endpoint.
+    register_exception_handlers(app)
 
     # --- Inject services into app.state for dependency resolution ---
     app.state.repository = repository
@@ -92,6 +195,15 @@ def create_app() -> FastAPI:
     app.state.auth_service = auth_service
     app.state.dashboard_service = dashboard_service
 
+    # Pin singleton providers. The state-backed getters stay as the portable
+    # default (tests hand-assemble apps around them), but here the instances
+    # are known at wiring time, so each Depends resolves to a zero-argument
+    # closure instead of a Request-scoped state lookup per call.
+    app.dependency_overrides[get_prediction_service] = lambda: prediction_service
+    app.dependency_overrides[get_matching_service] = lambda: matching_service
+    app.dependency_overrides[get_dashboard_service] = lambda: dashboard_service
+    app.dependency_overrides[get_auth_service] = lambda: auth_service
+
     return app
 
 
@@ -102,23 +214,56 @@ def _startup(app: FastAPI) -> None:
     Order matters:
       1. Schema must exist before seeding.
       2. BookingHistory must be populated before model training.
-      3. Demo requests are seeded before model training (not required, but logical order).
-      4. Model trains last — requires BookingHistory rows.
+      3. The two seeders are independent of each other and run concurrently;
+         each repository call opens its own SQLite connection, so the jobs
+         never share a cursor.
+      4. Model load/train needs BookingHistory rows only, so it starts as
+         soon as the booking seed finishes and overlaps the demo seed.
     """
-    repository: DataRepository = app.state.repository
+    global _STARTUP_COMPLETED
+    with _STARTUP_LOCK:
+        if _STARTUP_COMPLETED:
+            logger.info("Startup already completed in this process; skipping")
+            return
+        _run_startup_sequence(app)
+        _STARTUP_COMPLETED = True
+
+
+def _run_startup_sequence(app: FastAPI) -> None:
+    repository: DataRepository | None = getattr(app.state, "repository", None)
+    if repository is None:
+        # A bare FastAPI() passed in here would mean wiring never happened;
+        # failing loudly beats initializing a half-configured process.
+        raise RuntimeError("create_app() must wire services before startup runs")
     prediction_service: AvailabilityPredictionService = app.state.prediction_service
 
     logger.info("Startup: initializing database schema")
     repository.initialize_database()
 
-    logger.info("Startup: seeding synthetic booking history")
-    repository.seed_synthetic_data()
+    if repository.get_seed_version() < repository.SEED_DATA_VERSION:
+        logger.info("Startup: seeding booking history and demo requests concurrently")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            booking_seed = executor.submit(repository.seed_synthetic_data)
+            demo_seed = executor.submit(repository.seed_demo_requests_if_empty)
+            # Training only needs BookingHistory, so it overlaps with the
+            # independent demo-request seed instead of waiting for both.
+            booking_seed.result()
+            logger.info("Startup: loading or training availability prediction model")
+            prediction_service.load_or_train()
+            demo_seed.result()
+        repository.set_seed_version(repository.SEED_DATA_VERSION)
+    else:
+        logger.info("Startup: seed marker is current; skipping seed work")
+        logger.info("Startup: loading or training availability prediction model")
+        prediction_service.load_or_train()
 
-    logger.info("Startup: seeding demo allocation requests (skipped if Requests table not empty)")
-    repository.seed_demo_requests_if_empty()
+    # Rooms is fixed after seeding; pre-load it so per-request get_room
+    # validation is a dict hit from the first request on.
+    repository.warm_room_cache()
 
-    logger.info("Startup: training availability prediction model")
-    prediction_service.train_model()
+    # Only now is the database fully seeded and the model trained, so the
+    # background metrics warm-up can run against complete data.
+    app.state.dashboard_service.start_metrics_warmup()
 
     logger.info("Startup complete — system ready")
 
@@ -0,0 +1,20 @@
+"""Controller package: pre-merged router for the application factory.
+
+Merging the per-module routers here, at import time, means `create_app`
+calls `app.include_router` exactly once — FastAPI rebuilds its dependant
+graph and compiles path regexes per included route, so one merged mount
+halves that work versus including each controller router separately.
+"""
+
+from __future__ import annotations
+
+from fastapi import APIRouter
+
+from backend.controllers.allocation_controller import router as prediction_router
+from backend.controllers.dashboard_controller import router as dashboard_router
+
+root_router = APIRouter()
+root_router.include_router(prediction_router)
+root_router.include_router(dashboard_router)
+
+__all__ = ["root_router", "prediction_router", "dashboard_router"]
@@ -2,46 +2,71 @@
 
 from __future__ import annotations
 
-from datetime import date
-
-from fastapi import APIRouter, Depends, HTTPException, Request, status
-from pydantic import BaseModel, Field, field_validator
-
-from backend.controllers.dependencies import get_dashboard_service, require_admin
-from backend.services.matching_service import (
-    AllocationOptimizationService,
-    AllocationValidationError,
-    SolverDependencyError,
+import re
+from functools import lru_cache
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Request, status
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    StringConstraints,
+    TypeAdapter,
+    field_validator,
 )
-from backend.services.prediction_service import (
-    AvailabilityPredictionService,
-    ModelNotReadyError,
-    PredictionValidationError,
-    RoomNotFoundError,
+
+from backend.controllers.dependencies import (
+    get_dashboard_service,
+    require_admin,
+    require_state_service,
 )
-from backend.services.dashboard_service import DashboardValidationError, DashboardWorkflowService
-from backend.services.simulation_service import SimulationValidationError
-from backend.utils.config import get_settings
-from backend.utils.logger import get_logger
+from backend.services.matching_service import AllocationOptimizationService
+from backend.services.prediction_service import AvailabilityPredictionService
+from backend.services.dashboard_service import DashboardWorkflowService
+from backend.utils.config import get_time_slot_regex
+
 
+# Compiled once at import; every slot field below reuses the same pattern
+# instead of re-compiling it per model field. The dedicated accessor avoids
+# materializing the full Settings object during module import.
+_SLOT_RE = re.compile(get_time_slot_regex())
 
-logger = get_logger(__name__)
-settings = get_settings()
+TimeSlot = Annotated[str, StringConstraints(pattern=_SLOT_RE.pattern)]
 
-router = APIRouter(tags=["prediction"])
+# Request DTOs keep dates as validated ISO strings: every downstream service
+# call wants the string form, so parsing to datetime.date only to call
+# isoformat() per request would be wasted work.
+DateStr = Annotated[str, StringConstraints(pattern=r"^\d{4}-\d{2}-\d{2}$")]
+
+# Admin routes share one router-level auth dependency instead of repeating
+# it per route; public routes carry no auth edge at all.
+admin_router = APIRouter(tags=["prediction"], dependencies=[Depends(require_admin)])
+public_router = APIRouter(tags=["prediction"])
+
+
+@lru_cache(maxsize=1024)
+def _parse_slot(value: str) -> tuple[int, int]:
+    """Parse a validated ``HH-HH`` slot into hour bounds, cached per string."""
+    match = _SLOT_RE.fullmatch(value)
+    if match is None:
+        raise ValueError("time_slot must match HH-HH")
+    return int(match.group(1)), int(match.group(2))
 
 
 class AvailabilityPredictionRequest(BaseModel):
     """Input DTO validated before entering service layer."""
 
+    model_config = ConfigDict(populate_by_name=True)
+
     room_id: int = Field(gt=0)
-    date: date
-    time_slot: str = Field(pattern=settings.prediction_time_slot_regex)
+    date_str: DateStr = Field(alias="date")
+    time_slot: TimeSlot
 
     @field_validator("time_slot")
     @classmethod
     def validate_time_slot_boundaries(cls, value: str) -> str:
-        start_hour, end_hour = (int(item) for item in value.split("-"))
+        start_hour, end_hour = _parse_slot(value)
         if start_hour >= end_hour:
             raise ValueError("time_slot start hour must be less than end hour")
         return value
@@ -50,32 +75,45 @@ class AvailabilityPredictionRequest(BaseModel):
 class AvailabilityPredictionResponse(BaseModel):
     """Output DTO constrained to probability bounds."""
 
+    model_config = ConfigDict(defer_build=True)
+
     idle_probability: float = Field(ge=0.0, le=1.0)
     confidence_score: float = Field(ge=0.0, le=1.0)
 
 
 class AllocationDecisionResponse(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     request_id: int = Field(gt=0)
     room_id: int = Field(gt=0)
     score: float = Field(ge=0.0)
 
 
+# Compiled once; validates the solver's decision list in a single
+# core-schema walk instead of per-element model dispatch.
+_ALLOCATION_DECISIONS = TypeAdapter(list[AllocationDecisionResponse])
+
+
 class OptimizeAllocationRequest(BaseModel):
-    requested_date: date
-    requested_time_slot: str = Field(pattern=settings.prediction_time_slot_regex)
+    model_config = ConfigDict(populate_by_name=True)
+
+    requested_date: DateStr
+    requested_time_slot: TimeSlot
     idle_probability_threshold: float | None = Field(default=None, ge=0.0, le=1.0)
     stakeholder_usage_cap: float | None = Field(default=None, gt=0.0, le=1.0)
 
     @field_validator("requested_time_slot")
     @classmethod
     def validate_requested_slot_boundaries(cls, value: str) -> str:
-        start_hour, end_hour = (int(item) for item in value.split("-"))
+        start_hour, end_hour = _parse_slot(value)
         if start_hour >= end_hour:
             raise ValueError("requested_time_slot start hour must be less than end hour")
         return value
 
 
 class OptimizeAllocationResponse(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     allocations: list[AllocationDecisionResponse]
     objective_value: float = Field(ge=0.0)
     fairness_metric: float = Field(ge=0.0, le=1.0)
@@ -125,6 +163,8 @@ class SimulateRequest(BaseModel):
 
 
 class SimulationMetricsResponse(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     utilization_rate: float = Field(ge=0.0, le=1.0)
     requests_satisfied: int = Field(ge=0)
     objective_value: float = Field(ge=0.0)
@@ -134,6 +174,8 @@ class SimulationMetricsResponse(BaseModel):
 
 
 class SimulationDeltaResponse(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     utilization_change: float
     request_change: int
     objective_change: float
@@ -143,168 +185,116 @@ class SimulationDeltaResponse(BaseModel):
 
 
 class SimulateResponse(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     baseline: SimulationMetricsResponse
     simulation: SimulationMetricsResponse
     delta: SimulationDeltaResponse
 
 
 def get_prediction_service(request: Request) -> AvailabilityPredictionService:
-    service = getattr(request.app.state, "prediction_service", None)
-    if service is None:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Prediction service is not initialized",
-        )
-    return service
+    return require_state_service(
+        request,
+        "prediction_service",
+        "Prediction service is not initialized",
+    )
 
 
 def get_matching_service(request: Request) -> AllocationOptimizationService:
-    service = getattr(request.app.state, "matching_service", None)
-    if service is None:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Matching service is not initialized",
-        )
-    return service
+    return require_state_service(
+        request,
+        "matching_service",
+        "Matching service is not initialized",
+    )
 
 
-@router.post(
+@admin_router.post(
     "/predict_availability",
     response_model=AvailabilityPredictionResponse,
     status_code=status.HTTP_200_OK,
-    dependencies=[Depends(require_admin)],
 )
-async def predict_availability(
+def predict_availability(
     payload: AvailabilityPredictionRequest,
     service: AvailabilityPredictionService = Depends(get_prediction_service),
 ) -> AvailabilityPredictionResponse:
-    """Run inference only; model training lifecycle is managed at startup."""
-    try:
-        result = service.predict(
-            room_id=payload.room_id,
-            date=payload.date.isoformat(),
-            time_slot=payload.time_slot,
-        )
-        return AvailabilityPredictionResponse(**result)
-    except PredictionValidationError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(exc),
-        ) from exc
-    except RoomNotFoundError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(exc),
-        ) from exc
-    except ModelNotReadyError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=str(exc),
-        ) from exc
-    except Exception as exc:  # pragma: no cover - defensive fallback
-        logger.exception("Unexpected inference failure")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to generate prediction",
-        ) from exc
-
-
-@router.post(
+    """Run inference only; model training lifecycle is managed at startup.
+
+    Domain errors are translated to HTTP responses by the app-level handlers
+    in :mod:`backend.controllers.error_handlers`.
+    """
+    result = service.predict(
+        room_id=payload.room_id,
+        date=payload.date_str,
+        time_slot=payload.time_slot,
+    )
+    # Service output is already bounds-checked; skip re-validation.
+    return AvailabilityPredictionResponse.model_construct(**result)
+
+
+@admin_router.post(
     "/optimize_allocation",
     response_model=OptimizeAllocationResponse,
     status_code=status.HTTP_200_OK,
-    dependencies=[Depends(require_admin)],
 )
-async def optimize_allocation(
+def optimize_allocation(
     payload: OptimizeAllocationRequest,
     service: AllocationOptimizationService = Depends(get_matching_service),
 ) -> OptimizeAllocationResponse:
     """Run demand forecast and CP-SAT allocation optimization."""
-    try:
-        result = service.optimize_allocation(
-            requested_date=payload.requested_date.isoformat(),
-            requested_time_slot=payload.requested_time_slot,
-            idle_probability_threshold=payload.idle_probability_threshold,
-            stakeholder_usage_cap=payload.stakeholder_usage_cap,
-        )
-        return OptimizeAllocationResponse(
-            allocations=[
-                AllocationDecisionResponse(
-                    request_id=item.request_id,
-                    room_id=item.room_id,
-                    score=item.score,
-                )
-                for item in result.allocations
-            ],
-            objective_value=result.objective_value,
-            fairness_metric=result.fairness_metric,
-        )
-    except AllocationValidationError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(exc),
-        ) from exc
-    except SolverDependencyError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=str(exc),
-        ) from exc
-    except Exception as exc:  # pragma: no cover - defensive fallback
-        logger.exception("Unexpected optimization failure")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to optimize allocation",
-        ) from exc
-
-
-@router.post(
+    result = service.optimize_allocation(
+        requested_date=payload.requested_date,
+        requested_time_slot=payload.requested_time_slot,
+        idle_probability_threshold=payload.idle_probability_threshold,
+        stakeholder_usage_cap=payload.stakeholder_usage_cap,
+    )
+    # Solver output is already validated in the service layer, so the
+    # response models are assembled without a second validation pass.
+    return OptimizeAllocationResponse.model_construct(
+        allocations=_ALLOCATION_DECISIONS.validate_python(
+            result.allocations,
+            from_attributes=True,
+        ),
+        objective_value=result.objective_value,
+        fairness_metric=result.fairness_metric,
+    )
+
+
+@public_router.post(
     "/simulate",
     response_model=SimulateResponse,
     status_code=status.HTTP_200_OK,
 )
-async def simulate(
+def simulate(
     payload: SimulateRequest,
     workflow_service: DashboardWorkflowService = Depends(get_dashboard_service),
     _: None = Depends(require_admin),
 ) -> SimulateResponse:
     """Run an isolated in-memory what-if simulation."""
-    try:
-        effective_idle_threshold = (
-            payload.idle_probability_threshold
-            if payload.idle_probability_threshold is not None
-            else payload.temporary_constraints.idle_threshold
-        )
-        effective_stakeholder_cap = (
-            payload.stakeholder_usage_cap
-            if payload.stakeholder_usage_cap is not None
-            else payload.temporary_constraints.stakeholder_cap
-        )
-        result = workflow_service.run_simulation(
-            idle_probability_threshold=effective_idle_threshold,
-            stakeholder_usage_cap=effective_stakeholder_cap,
-            stakeholder_priority_weight=payload.stakeholder_priority_weight,
-            capacity_override=payload.temporary_constraints.capacity_override,
-            priority_adjustment=payload.temporary_constraints.priority_adjustment,
-        )
-        return SimulateResponse(**result)
-    except (SimulationValidationError, DashboardValidationError) as exc:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(exc),
-        ) from exc
-    except AllocationValidationError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(exc),
-        ) from exc
-    except SolverDependencyError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=str(exc),
-        ) from exc
-    except Exception as exc:  # pragma: no cover - defensive fallback
-        logger.exception("Unexpected simulation failure")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to run simulation",
-        ) from exc
+    effective_idle_threshold = (
+        payload.idle_probability_threshold
+        if payload.idle_probability_threshold is not None
+        else payload.temporary_constraints.idle_threshold
+    )
+    effective_stakeholder_cap = (
+        payload.stakeholder_usage_cap
+        if payload.stakeholder_usage_cap is not None
+        else payload.temporary_constraints.stakeholder_cap
+    )
+    result = workflow_service.run_simulation(
+        idle_probability_threshold=effective_idle_threshold,
+        stakeholder_usage_cap=effective_stakeholder_cap,
+        stakeholder_priority_weight=payload.stakeholder_priority_weight,
+        capacity_override=payload.temporary_constraints.capacity_override,
+        priority_adjustment=payload.temporary_constraints.priority_adjustment,
+    )
+    return SimulateResponse.model_construct(
+        baseline=SimulationMetricsResponse.model_construct(**result["baseline"]),
+        simulation=SimulationMetricsResponse.model_construct(**result["simulation"]),
+        delta=SimulationDeltaResponse.model_construct(**result["delta"]),
+    )
+
+
+# Combined router kept as the module's public export.
+router = APIRouter()
+router.include_router(public_router)
+router.include_router(admin_router)
@@ -2,40 +2,31 @@
 
 from __future__ import annotations
 
+import os
 from datetime import date
 from pathlib import Path
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, status
 from fastapi.responses import FileResponse
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 
+from backend.controllers.allocation_controller import DateStr, TimeSlot
 from backend.controllers.dependencies import get_auth_service, get_dashboard_service, require_admin
-from backend.services.auth_service import (
-    AdminTokenNotConfiguredError,
-    AuthService,
-    InvalidAdminTokenError,
-)
-from backend.services.dashboard_service import (
-    AllocationDraftNotFoundError,
-    DashboardValidationError,
-    DashboardWorkflowService,
-)
-from backend.services.matching_service import AllocationValidationError, SolverDependencyError
-from backend.services.prediction_service import (
-    ModelNotReadyError,
-    PredictionValidationError,
-    RoomNotFoundError,
-)
-from backend.services.simulation_service import SimulationValidationError
-from backend.utils.config import get_settings
-from backend.utils.logger import get_logger
+from backend.services.auth_service import AuthService
+from backend.services.dashboard_service import DashboardWorkflowService
 
 
-logger = get_logger(__name__)
-settings = get_settings()
+admin_router = APIRouter(tags=["dashboard"], dependencies=[Depends(require_admin)])
+public_router = APIRouter(tags=["dashboard"])
 
-router = APIRouter(tags=["dashboard"])
+# Resolved once — Path.resolve() walks the symlink chain with syscalls, and the
+# cached stat result lets FileResponse skip its per-request stat as well.
+_DASHBOARD_FILE = Path(__file__).resolve().parents[2] / "dashboard" / "index.html"
+try:
+    _DASHBOARD_STAT: os.stat_result | None = _DASHBOARD_FILE.stat()
+except OSError:  # pragma: no cover - dashboard asset missing in this checkout
+    _DASHBOARD_STAT = None
 
 
 class LoginRequest(BaseModel):
@@ -43,13 +34,17 @@ class LoginRequest(BaseModel):
 
 
 class LoginResponse(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     access_token: str
     token_type: str = "bearer"
 
 
 class PredictRequest(BaseModel):
-    date: date
-    time_slot: str = Field(pattern=settings.prediction_time_slot_regex)
+    model_config = ConfigDict(populate_by_name=True)
+
+    date_str: DateStr = Field(alias="date")
+    time_slot: TimeSlot
     room_ids: Optional[list[int]] = None
 
     @field_validator("room_ids")
@@ -66,41 +61,61 @@ class PredictRequest(BaseModel):
 
 
 class PredictRow(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     room_id: int = Field(gt=0)
     date: date
-    time_slot: str = Field(pattern=settings.prediction_time_slot_regex)
+    time_slot: TimeSlot
     predicted_idle_probability: float = Field(ge=0.0, le=1.0)
     confidence_score: float = Field(ge=0.0, le=1.0)
 
 
 class PredictResponse(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     predictions: list[PredictRow]
 
 
+# Compiled once; validating a whole list through one adapter is a single
+# core-schema walk instead of per-element model dispatch.
+_PREDICT_ROWS = TypeAdapter(list[PredictRow])
+
+
 class AllocateRequest(BaseModel):
-    requested_date: date
-    requested_time_slot: str = Field(pattern=settings.prediction_time_slot_regex)
+    model_config = ConfigDict(populate_by_name=True)
+
+    requested_date: DateStr
+    requested_time_slot: TimeSlot
     idle_probability_threshold: float | None = Field(default=None, ge=0.0, le=1.0)
     stakeholder_usage_cap: float | None = Field(default=None, gt=0.0, le=1.0)
 
 
 class AllocationRow(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     room_id: int | None = Field(default=None, gt=0)
     stakeholder: str = Field(min_length=1)
-    time_slot: str = Field(pattern=settings.prediction_time_slot_regex)
+    time_slot: TimeSlot
     allocation_score: float = Field(ge=0.0)
     priority_weight: float = Field(gt=0.0)
     constraint_status: str = Field(min_length=1)
 
 
 class AllocateResponse(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     allocations: list[AllocationRow]
     objective_value: float = Field(ge=0.0)
     fairness_metric: float = Field(ge=0.0, le=1.0)
     unassigned_request_ids: list[int]
 
 
+_ALLOCATION_ROWS = TypeAdapter(list[AllocationRow])
+
+
 class ApproveResponse(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     status: str
     approved_allocations_count: int = Field(ge=0)
     objective_value: float = Field(ge=0.0)
@@ -108,6 +123,8 @@ class ApproveResponse(BaseModel):
 
 
 class MetricsResponse(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     baseline_idle_activation_rate: float
     simulated_idle_activation_rate: float
     allocation_efficiency_score: float
@@ -115,210 +132,125 @@ class MetricsResponse(BaseModel):
 
 
 class PendingWindowResponse(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     requested_date: date
-    requested_time_slot: str = Field(pattern=settings.prediction_time_slot_regex)
+    requested_time_slot: TimeSlot
     request_count: int = Field(ge=0)
 
 
+_PENDING_WINDOWS = TypeAdapter(list[PendingWindowResponse])
+
+
 class DemoContextResponse(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     default_date: date | None = None
-    default_time_slot: str | None = Field(
-        default=None,
-        pattern=settings.prediction_time_slot_regex,
-    )
+    default_time_slot: TimeSlot | None = None
     pending_windows: list[PendingWindowResponse]
     pending_request_count: int = Field(ge=0)
 
 
-@router.get("/", include_in_schema=False)
+@public_router.get("/", include_in_schema=False)
 async def dashboard_home() -> FileResponse:
-    project_root = Path(__file__).resolve().parents[2]
-    dashboard_file = project_root / "dashboard" / "index.html"
-    return FileResponse(path=dashboard_file)
+    return FileResponse(path=_DASHBOARD_FILE, stat_result=_DASHBOARD_STAT)
 
 
-@router.get("/dashboard", include_in_schema=False)
+@public_router.get("/dashboard", include_in_schema=False)
 async def dashboard_page() -> FileResponse:
-    return await dashboard_home()
+    return FileResponse(path=_DASHBOARD_FILE, stat_result=_DASHBOARD_STAT)
 
 
-@router.get("/demo_context", response_model=DemoContextResponse, status_code=status.HTTP_200_OK)
-async def demo_context(
+@public_router.get("/demo_context", response_model=DemoContextResponse, status_code=status.HTTP_200_OK)
+def demo_context(
     workflow_service: DashboardWorkflowService = Depends(get_dashboard_service),
 ) -> DemoContextResponse:
-    try:
-        result = workflow_service.get_demo_context()
-        return DemoContextResponse(**result)
-    except Exception as exc:  # pragma: no cover - defensive fallback
-        logger.exception("Unexpected demo context failure")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to load demo context",
-        ) from exc
-
-
-@router.post("/login", response_model=LoginResponse, status_code=status.HTTP_200_OK)
+    result = workflow_service.get_demo_context()
+    default_date = result["default_date"]
+    return DemoContextResponse.model_construct(
+        default_date=date.fromisoformat(default_date) if default_date else None,
+        default_time_slot=result["default_time_slot"],
+        pending_windows=_PENDING_WINDOWS.validate_python(result["pending_windows"]),
+        pending_request_count=result["pending_request_count"],
+    )
+
+
+@public_router.post("/login", response_model=LoginResponse, status_code=status.HTTP_200_OK)
 async def login(
     payload: LoginRequest,
     auth_service: AuthService = Depends(get_auth_service),
 ) -> LoginResponse:
-    try:
-        bearer = auth_service.login(payload.admin_token)
-        return LoginResponse(access_token=bearer)
-    except (AdminTokenNotConfiguredError, InvalidAdminTokenError) as exc:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=str(exc),
-        ) from exc
-    except Exception as exc:  # pragma: no cover - defensive fallback
-        logger.exception("Unexpected login failure")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to login",
-        ) from exc
-
-
-@router.post(
+    bearer = auth_service.login(payload.admin_token)
+    return LoginResponse(access_token=bearer)
+
+
+@admin_router.post(
     "/predict",
     response_model=PredictResponse,
     status_code=status.HTTP_200_OK,
-    dependencies=[Depends(require_admin)],
 )
-async def predict(
+def predict(
     payload: PredictRequest,
     workflow_service: DashboardWorkflowService = Depends(get_dashboard_service),
 ) -> PredictResponse:
-    try:
-        result = workflow_service.predict_idle_probabilities(
-            target_date=payload.date.isoformat(),
-            target_time_slot=payload.time_slot,
-            room_ids=payload.room_ids,
-        )
-        return PredictResponse(**result)
-    except PredictionValidationError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(exc),
-        ) from exc
-    except RoomNotFoundError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(exc),
-        ) from exc
-    except ModelNotReadyError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=str(exc),
-        ) from exc
-    except Exception as exc:  # pragma: no cover - defensive fallback
-        logger.exception("Unexpected dashboard prediction failure")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to run prediction workflow",
-        ) from exc
-
-
-@router.post(
+    result = workflow_service.predict_idle_probabilities(
+        target_date=payload.date_str,
+        target_time_slot=payload.time_slot,
+        room_ids=payload.room_ids,
+    )
+    return PredictResponse.model_construct(
+        predictions=_PREDICT_ROWS.validate_python(result["predictions"])
+    )
+
+
+@admin_router.post(
     "/allocate",
     response_model=AllocateResponse,
     status_code=status.HTTP_200_OK,
-    dependencies=[Depends(require_admin)],
 )
-async def allocate(
+def allocate(
     payload: AllocateRequest,
     workflow_service: DashboardWorkflowService = Depends(get_dashboard_service),
 ) -> AllocateResponse:
-    try:
-        result = workflow_service.preview_allocation(
-            requested_date=payload.requested_date.isoformat(),
-            requested_time_slot=payload.requested_time_slot,
-            idle_probability_threshold=payload.idle_probability_threshold,
-            stakeholder_usage_cap=payload.stakeholder_usage_cap,
-        )
-        return AllocateResponse(**result)
-    except AllocationValidationError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(exc),
-        ) from exc
-    except SolverDependencyError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=str(exc),
-        ) from exc
-    except Exception as exc:  # pragma: no cover - defensive fallback
-        logger.exception("Unexpected dashboard allocation failure")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to run allocation workflow",
-        ) from exc
-
-
-@router.post(
+    result = workflow_service.preview_allocation(
+        requested_date=payload.requested_date,
+        requested_time_slot=payload.requested_time_slot,
+        idle_probability_threshold=payload.idle_probability_threshold,
+        stakeholder_usage_cap=payload.stakeholder_usage_cap,
+    )
+    return AllocateResponse.model_construct(
+        allocations=_ALLOCATION_ROWS.validate_python(result["allocations"]),
+        objective_value=result["objective_value"],
+        fairness_metric=result["fairness_metric"],
+        unassigned_request_ids=result["unassigned_request_ids"],
+    )
+
+
+@admin_router.post(
     "/approve",
     response_model=ApproveResponse,
     status_code=status.HTTP_200_OK,
-    dependencies=[Depends(require_admin)],
 )
-async def approve(
+def approve(
     workflow_service: DashboardWorkflowService = Depends(get_dashboard_service),
 ) -> ApproveResponse:
-    try:
-        result = workflow_service.approve_latest_allocation()
-        return ApproveResponse(**result)
-    except AllocationDraftNotFoundError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(exc),
-        ) from exc
-    except AllocationValidationError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(exc),
-        ) from exc
-    except SolverDependencyError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=str(exc),
-        ) from exc
-    except Exception as exc:  # pragma: no cover - defensive fallback
-        logger.exception("Unexpected dashboard approval failure")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to approve allocation",
-        ) from exc
-
-
-@router.get(
+    result = workflow_service.approve_latest_allocation()
+    return ApproveResponse.model_construct(**result)
+
+
+@admin_router.get(
     "/metrics",
     response_model=MetricsResponse,
     status_code=status.HTTP_200_OK,
-    dependencies=[Depends(require_admin)],
 )
-async def get_metrics(
+def get_metrics(
     workflow_service: DashboardWorkflowService = Depends(get_dashboard_service),
 ) -> MetricsResponse:
-    try:
-        result = workflow_service.get_metrics()
-        return MetricsResponse(**result)
-    except (DashboardValidationError, SimulationValidationError) as exc:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(exc),
-        ) from exc
-    except AllocationValidationError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(exc),
-        ) from exc
-    except SolverDependencyError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=str(exc),
-        ) from exc
-    except Exception as exc:  # pragma: no cover - defensive fallback
-        logger.exception("Unexpected dashboard metrics failure")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to compute metrics",
-        ) from exc
+    result = workflow_service.get_metrics()
+    return MetricsResponse.model_construct(**result)
+
+
+# Combined router kept as the module's public export.
+router = APIRouter()
+router.include_router(public_router)
+router.include_router(admin_router)
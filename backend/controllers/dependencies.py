@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from fastapi import Depends, HTTPException, Request, status
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from backend.services.auth_service import (
     AdminTokenNotConfiguredError,
@@ -14,59 +15,85 @@ from backend.services.dashboard_service import DashboardWorkflowService
 from backend.utils.config import get_settings
 
 
-bearer_scheme = HTTPBearer(auto_error=False)
+def require_state_service(request: Request, name: str, detail: str) -> Any:
+    """Fetch a service wired onto ``app.state`` by the factory.
+
+    Starlette's ``State`` stores attributes in its ``_state`` dict; reading it
+    directly is a single dict lookup instead of ``getattr`` dispatch through
+    ``State.__getattr__`` on every request.
+    """
+    service = request.app.state._state.get(name)
+    if service is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=detail,
+        )
+    return service
 
 
 def get_auth_service(request: Request) -> AuthService:
-    service = getattr(request.app.state, "auth_service", None)
+    service = request.app.state._state.get("auth_service")
     if service is None:
         service = AuthService(settings=get_settings())
         request.app.state.auth_service = service
-    if service is None:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Auth service is not initialized",
-        )
     return service
 
 
 def get_dashboard_service(request: Request) -> DashboardWorkflowService:
-    service = getattr(request.app.state, "dashboard_service", None)
-    if service is None:
-        repository = getattr(request.app.state, "repository", None)
-        prediction_service = getattr(request.app.state, "prediction_service", None)
-        matching_service = getattr(request.app.state, "matching_service", None)
-        simulation_service = getattr(request.app.state, "simulation_service", None)
-        if repository is not None:
-            service = DashboardWorkflowService(
-                repository=repository,
-                prediction_service=prediction_service,
-                matching_service=matching_service,
-                simulation_service=simulation_service,
-                settings=get_settings(),
-            )
-            request.app.state.dashboard_service = service
+    service = request.app.state._state.get("dashboard_service")
     if service is None:
+        service = _build_dashboard_service(request)
+    return service
+
+
+def _build_dashboard_service(request: Request) -> DashboardWorkflowService:
+    """Cold path: construct the workflow service for apps wired without the factory.
+
+    `create_app` always populates ``app.state.dashboard_service``, so this only
+    runs once for hand-assembled apps (e.g. focused test harnesses); the result
+    is cached back onto ``app.state``.
+    """
+    state = request.app.state
+    repository = state._state.get("repository")
+    if repository is None:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Dashboard service is not initialized",
         )
+    service = DashboardWorkflowService(
+        repository=repository,
+        prediction_service=state._state.get("prediction_service"),
+        matching_service=state._state.get("matching_service"),
+        simulation_service=state._state.get("simulation_service"),
+        settings=get_settings(),
+    )
+    state.dashboard_service = service
     return service
 
 
 async def require_admin(
-    credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
+    request: Request,
     auth_service: AuthService = Depends(get_auth_service),
 ) -> None:
+    """Validate the admin bearer token from the Authorization header.
+
+    The header is parsed by hand rather than through ``HTTPBearer`` — the
+    security machinery allocates a credentials object and regex-matches the
+    scheme per request, all of which is wasted work when auth is disabled.
+    """
     if not auth_service.auth_enabled:
         return
-    if credentials is None:
+    header = request.headers.get("authorization")
+    scheme, _, token = (header or "").partition(" ")
+    # RFC 7235 auth schemes are case-insensitive; clients legitimately send
+    # "bearer <token>", so only the token itself is compared verbatim.
+    if scheme.lower() != "bearer" or not token.strip():
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Authorization header with Bearer token is required",
         )
     try:
-        auth_service.validate_bearer_token(credentials.credentials)
+        auth_service.validate_bearer_token(token.strip())
     except (AdminTokenNotConfiguredError, InvalidAdminTokenError) as exc:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
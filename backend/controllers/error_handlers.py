@@ -0,0 +1,76 @@
+"""Data-driven mapping from domain exceptions to HTTP responses.
+
+Registering the mapping once per app replaces the per-endpoint
+``try/except`` ladders the controllers used to carry: the error path goes
+through Starlette's handler lookup instead of walking a chain of except
+clauses and re-raising ``HTTPException`` by hand.
+"""
+
+from __future__ import annotations
+
+from typing import Awaitable, Callable
+
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
+
+from backend.services.auth_service import (
+    AdminTokenNotConfiguredError,
+    InvalidAdminTokenError,
+)
+from backend.services.dashboard_service import (
+    AllocationDraftNotFoundError,
+    DashboardValidationError,
+)
+from backend.services.matching_service import AllocationValidationError, SolverDependencyError
+from backend.services.prediction_service import (
+    ModelNotReadyError,
+    PredictionValidationError,
+    RoomNotFoundError,
+)
+from backend.services.simulation_service import SimulationValidationError
+from backend.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+EXCEPTION_STATUS_MAP: dict[type[Exception], int] = {
+    PredictionValidationError: status.HTTP_400_BAD_REQUEST,
+    AllocationValidationError: status.HTTP_400_BAD_REQUEST,
+    DashboardValidationError: status.HTTP_400_BAD_REQUEST,
+    SimulationValidationError: status.HTTP_400_BAD_REQUEST,
+    AllocationDraftNotFoundError: status.HTTP_400_BAD_REQUEST,
+    AdminTokenNotConfiguredError: status.HTTP_401_UNAUTHORIZED,
+    InvalidAdminTokenError: status.HTTP_401_UNAUTHORIZED,
+    RoomNotFoundError: status.HTTP_404_NOT_FOUND,
+    ModelNotReadyError: status.HTTP_503_SERVICE_UNAVAILABLE,
+    SolverDependencyError: status.HTTP_503_SERVICE_UNAVAILABLE,
+}
+
+
+def _make_handler(
+    status_code: int,
+) -> Callable[[Request, Exception], Awaitable[JSONResponse]]:
+    async def handler(request: Request, exc: Exception) -> JSONResponse:
+        return JSONResponse({"detail": str(exc)}, status_code=status_code)
+
+    return handler
+
+
+async def _unhandled_exception(request: Request, exc: Exception) -> JSONResponse:
+    logger.exception(
+        "Unhandled error on %s %s",
+        request.method,
+        request.url.path,
+        exc_info=exc,
+    )
+    return JSONResponse(
+        {"detail": "Internal server error"},
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+    )
+
+
+def register_exception_handlers(app: FastAPI) -> None:
+    """Attach one handler per domain exception plus a logging 500 catch-all."""
+    for exc_class, status_code in EXCEPTION_STATUS_MAP.items():
+        app.add_exception_handler(exc_class, _make_handler(status_code))
+    app.add_exception_handler(Exception, _unhandled_exception)
@@ -3,6 +3,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from backend.utils.config import Settings
 
 
 @dataclass(frozen=True)
@@ -26,5 +31,25 @@ def validate_allocation_config(config: AllocationConfig) -> None:
         raise ValueError("solver_random_seed must be >= 0")
     if config.objective_scale <= 0:
         raise ValueError("objective_scale must be > 0")
-    if config.cp_sat_workers <= 0:
-        raise ValueError("cp_sat_workers must be > 0")
+    if config.cp_sat_workers < 0:
+        raise ValueError("cp_sat_workers must be >= 0 (0 = auto-size to host cores)")
+
+
+@lru_cache(maxsize=1)
+def allocation_config_from(settings: "Settings") -> AllocationConfig:
+    """Build and validate the allocation config for a settings object, once.
+
+    Settings are frozen (and therefore hashable), so for process lifetime
+    there is exactly one config instance per settings object instead of a
+    fresh six-field dataclass per service construction or simulation run.
+    """
+    config = AllocationConfig(
+        idle_probability_threshold=settings.allocation_idle_probability_threshold,
+        stakeholder_usage_cap=settings.allocation_stakeholder_usage_cap,
+        solver_max_time_seconds=settings.allocation_solver_max_time_seconds,
+        solver_random_seed=settings.allocation_solver_random_seed,
+        objective_scale=settings.allocation_objective_scale,
+        cp_sat_workers=settings.allocation_cp_sat_workers,
+    )
+    validate_allocation_config(config)
+    return config
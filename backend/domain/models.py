@@ -1,17 +1,22 @@
-"""Domain models for demand forecasting and allocation optimization."""
+"""Domain models for demand forecasting and allocation optimization.
+
+These are instantiated by the thousands per allocation run (one per
+request/room/prediction), so they are slotted: no per-instance __dict__,
+cheaper construction, and smaller footprint than plain frozen dataclasses.
+"""
 
 from __future__ import annotations
 
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Room:
     room_id: int
     capacity: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AllocationRequest:
     request_id: int
     requested_capacity: int
@@ -21,7 +26,7 @@ class AllocationRequest:
     stakeholder_id: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IdlePrediction:
     room_id: int
     date: str
@@ -29,14 +34,14 @@ class IdlePrediction:
     idle_probability: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DemandForecast:
     time_slot: str
     historical_count: int
     demand_intensity_score: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AllocationDecision:
     request_id: int
     room_id: int
@@ -44,7 +49,7 @@ class AllocationDecision:
     stakeholder_id: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OptimizationResult:
     allocations: list[AllocationDecision]
     objective_value: float
@@ -0,0 +1,46 @@
+"""Interned integer codes for stakeholder identifiers.
+
+Stakeholder ids are short strings ("deptA", "clubB", ...) that the
+allocation hot paths group and count repeatedly. Hashing the same string
+on every dict lookup is wasted work; a registry assigns each distinct id
+a small contiguous integer once, so downstream code can index arrays and
+run ``np.bincount`` over codes instead of hashing strings. The codes are
+process-internal — strings stay the wire and storage format, decoded only
+at the boundary.
+"""
+
+from __future__ import annotations
+
+
+class StakeholderRegistry:
+    """Bidirectional string-to-code mapping with insertion-ordered codes."""
+
+    __slots__ = ("_code_by_name", "_names")
+
+    def __init__(self) -> None:
+        self._code_by_name: dict[str, int] = {}
+        self._names: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def encode(self, name: str) -> int:
+        """Return the code for ``name``, registering it on first sight."""
+        code = self._code_by_name.get(name)
+        if code is None:
+            code = len(self._names)
+            self._code_by_name[name] = code
+            self._names.append(name)
+        return code
+
+    def decode(self, code: int) -> str:
+        """Return the original string for a previously issued code."""
+        return self._names[code]
+
+    @classmethod
+    def from_names(cls, names: list[str]) -> "StakeholderRegistry":
+        """Build a registry whose codes follow the order of ``names``."""
+        registry = cls()
+        for name in names:
+            registry.encode(name)
+        return registry
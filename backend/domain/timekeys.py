@@ -0,0 +1,44 @@
+"""Compact integer keys for (date, time-slot) pairs.
+
+Dates and slots repeat heavily within a run (every request for a day
+shares one date, slots come from a fixed daily grid), so the string
+forms are parsed once through small lru_caches and reduced to ints:
+proleptic-Gregorian ordinal days and the slot's start hour. A packed
+``(days << 8) | slot`` key turns dict keys and cache lookups that were
+two-string tuples into single machine-int hashes. Strings remain the
+boundary format — keys never leak into JSON or SQLite.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4096)
+def date_to_days(value: str) -> int:
+    """Parse ``YYYY-MM-DD`` to an ordinal day count; raises ValueError."""
+    return date.fromisoformat(value).toordinal()
+
+
+def days_to_date(days: int) -> str:
+    """Inverse of :func:`date_to_days`."""
+    return date.fromordinal(days).isoformat()
+
+
+@lru_cache(maxsize=64)
+def slot_to_index(slot: str) -> int:
+    """Map an ``HH-HH`` slot to its start hour (0..23); raises ValueError.
+
+    Accepts single-digit start hours ("9-11") as well as zero-padded ones
+    ("09-11") — the matching service's slot pattern allows both forms.
+    """
+    start_hour = int(slot.split("-", 1)[0])
+    if not 0 <= start_hour <= 23:
+        raise ValueError(f"slot start hour out of range: {slot!r}")
+    return start_hour
+
+
+def pack_time_key(date_value: str, slot: str) -> int:
+    """Pack a (date, slot) pair into one int key for dict/cache lookups."""
+    return (date_to_days(date_value) << 8) | slot_to_index(slot)
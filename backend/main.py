@@ -8,10 +8,29 @@ The application has been restructured so that:
 This file exists only to preserve import compatibility for any code that
 references backend.main directly (e.g. legacy test helpers).
 
+Re-exports are resolved lazily via module ``__getattr__`` (PEP 562):
+importing ``backend.main`` on its own no longer constructs the FastAPI
+application — and with it sklearn, pandas, and OR-Tools — unless one of
+the re-exported names is actually accessed.
+
 For all new code, import from the project root:
     from app import app, create_app
 """
 
-from app import app, create_app, _startup as startup  # noqa: F401
+from __future__ import annotations
+
+from typing import Any
 
 __all__ = ["app", "create_app", "startup"]
+
+
+def __getattr__(name: str) -> Any:
+    if name in ("app", "create_app"):
+        import app as _app_module
+
+        return getattr(_app_module, name)
+    if name == "startup":
+        import app as _app_module
+
+        return _app_module._startup
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
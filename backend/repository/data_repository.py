@@ -3,12 +3,18 @@
 from __future__ import annotations
 
 import csv
-import random
+import queue
 import sqlite3
+import sys
+import threading
+import time
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Iterable, List, Optional, Sequence
+from typing import Iterable, Iterator, Optional, Sequence
+
+import numpy as np
 
 from backend.domain.models import AllocationRequest, DemandForecast, IdlePrediction, Room
 from backend.utils.config import Settings, get_settings
@@ -17,6 +23,67 @@ from backend.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# SQL for the hottest per-request statements, promoted to module constants.
+# sqlite3's per-connection statement cache is keyed by the query text, so a
+# single shared string guarantees every call hits the same prepared VDBE
+# program instead of re-parsing ~hundreds of opcodes.
+_SQL_GET_ROOM = "SELECT id, room_type FROM Rooms WHERE id = ?;"
+_SQL_GET_REQUEST_STATUS = "SELECT status FROM Requests WHERE id = ?;"
+_SQL_HISTORICAL_OCCUPANCY = """
+    SELECT AVG(occupied) AS avg_occupied
+    FROM BookingHistory
+    WHERE room_id = ? AND time_slot = ?;
+"""
+_SQL_ROLLING_OCCUPANCY = """
+    SELECT AVG(occupied) AS rolling_avg
+    FROM BookingHistory
+    WHERE room_id = ?
+      AND time_slot = ?
+      AND date < ?
+      AND date >= date(?, ?);
+"""
+_SQL_HISTORICAL_OCCUPANCY_BY_ROOM = """
+    SELECT room_id, AVG(occupied) AS avg_occupied
+    FROM BookingHistory
+    WHERE time_slot = ?
+    GROUP BY room_id;
+"""
+_SQL_ROLLING_OCCUPANCY_BY_ROOM = """
+    SELECT room_id, AVG(occupied) AS rolling_avg
+    FROM BookingHistory
+    WHERE time_slot = ?
+      AND date < ?
+      AND date >= date(?, ?)
+    GROUP BY room_id;
+"""
+_SQL_SAVE_PREDICTION = """
+    INSERT INTO Predictions (room_id, date, time_slot, idle_probability)
+    VALUES (?, ?, ?, ?);
+"""
+# Fixed-width IN() template for status updates. A dynamically-sized
+# placeholder list compiles a distinct VDBE program per length (statement-
+# cache miss every time) and can exceed SQLITE_MAX_VARIABLE_NUMBER on large
+# batches; short chunks are padded with a repeated id, which IN() ignores.
+_MARK_ALLOCATED_CHUNK_SIZE = 128
+_SQL_MARK_ALLOCATED = (
+    "UPDATE Requests SET status = 'ALLOCATED' WHERE id IN ("
+    + ",".join("?" * _MARK_ALLOCATED_CHUNK_SIZE)
+    + ");"
+)
+# Multi-row VALUES template for the seed bulk load. executemany re-runs the
+# VDBE program once per row; a 100-row statement (400 parameters, well under
+# the 999 variable limit) runs it once per chunk, and the constant SQL text
+# for full chunks keeps hitting the statement cache.
+_SEED_INSERT_CHUNK_SIZE = 100
+_SQL_SEED_INSERT_PREFIX = (
+    "INSERT OR IGNORE INTO BookingHistory (room_id, date, time_slot, occupied) VALUES "
+)
+_SQL_SEED_INSERT_FULL_CHUNK = (
+    _SQL_SEED_INSERT_PREFIX
+    + ",".join(["(?, ?, ?, ?)"] * _SEED_INSERT_CHUNK_SIZE)
+    + ";"
+)
+
 
 @dataclass(frozen=True)
 class RoomRecord:
@@ -27,19 +94,35 @@ class RoomRecord:
 
 
 @dataclass(frozen=True)
-class BookingRecord:
-    """Joined booking projection for model training."""
+class BookingColumns:
+    """Columnar (structure-of-arrays) booking projection for model training.
 
-    room_id: int
-    date: str
-    time_slot: str
-    occupied: int
-    room_type: str
+    One NumPy array per column instead of an object per row: the full-history
+    read feeds pandas/sklearn directly without building thousands of small
+    Python objects first.
+    """
+
+    room_id: np.ndarray
+    date: np.ndarray
+    time_slot: np.ndarray
+    occupied: np.ndarray
+    room_type: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.room_id.shape[0])
 
 
 class DataRepository:
     """Encapsulates SQLite access so business logic stays storage-agnostic."""
 
+    # Stored in PRAGMA user_version once seeding has completed; bumping it
+    # forces a reseed on the next startup.
+    SEED_DATA_VERSION = 1
+
+    # Recorded in the SchemaVersion table once initialize_database has run
+    # its DDL; bump whenever that DDL changes so existing databases migrate.
+    SCHEMA_VERSION = 2
+
     _SYNTHETIC_COLUMNS = ("room_id", "date", "time_slot", "occupied")
     _SYNTHETIC_WEEKDAY_PROBABILITY_RANGE = (0.65, 0.75)
     _SYNTHETIC_WEEKEND_PROBABILITY_RANGE = (0.30, 0.40)
@@ -73,6 +156,44 @@ class DataRepository:
         self._synthetic_dataset_path = (
             self._db_path.parent / self._settings.synthetic_dataset_filename
         )
+        # Bounded pool of long-lived connections shared by every repository
+        # method. Opening a sqlite3 connection costs several milliseconds and
+        # discards the warm page cache; pooling amortizes setup and keeps hot
+        # pages resident between calls, and it lets the concurrent seed jobs
+        # run on separate connections.
+        self._pool: queue.Queue[sqlite3.Connection] = queue.Queue(
+            maxsize=self._settings.db_pool_max_connections
+        )
+        self._pool_lock = threading.Lock()
+        self._pool_connections_created = 0
+        # journal_mode=WAL is persistent in the database file, so only the
+        # first connection needs to issue it (it takes an exclusive lock).
+        self._wal_applied = False
+        # Short-TTL caches for the two whole-table aggregates every prediction
+        # request touches. BookingHistory only changes during seeding, which
+        # invalidates them explicitly; the TTL is a safety net against any
+        # out-of-band write.
+        self._aggregate_cache_ttl_seconds = 60.0
+        self._aggregate_cache_lock = threading.Lock()
+        self._global_occupancy_cache: Optional[tuple[float, float]] = None
+        self._known_slots_cache: Optional[tuple[tuple[str, ...], float]] = None
+        # Rooms is a ten-row catalog written only by seeding; cache lookups
+        # (including misses) so per-request validation never round-trips to
+        # sqlite for the same ids.
+        self._room_cache: dict[int, Optional[RoomRecord]] = {}
+        # Monotonic revision of the Requests table, bumped by every write
+        # path in this process. Services cache request-derived aggregates
+        # against it instead of re-querying per call.
+        self._pending_requests_version = 0
+        # Pre-open the configured minimum so the first requests after boot do
+        # not pay connection setup; the rest are created lazily on demand.
+        warm_connections = min(
+            self._settings.db_pool_min_connections,
+            self._settings.db_pool_max_connections,
+        )
+        for _ in range(max(0, warm_connections)):
+            self._pool_connections_created += 1
+            self._pool.put(self._new_pooled_connection())
 
     @property
     def database_path(self) -> Path:
@@ -82,12 +203,82 @@ class DataRepository:
     def synthetic_dataset_path(self) -> Path:
         return self._synthetic_dataset_path
 
-    def _connect(self) -> sqlite3.Connection:
-        connection = sqlite3.connect(self._db_path)
+    def _new_pooled_connection(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self._db_path,
+            check_same_thread=False,
+            cached_statements=256,
+        )
         connection.row_factory = sqlite3.Row
         connection.execute("PRAGMA foreign_keys = ON;")
+        if not self._wal_applied:
+            connection.execute("PRAGMA journal_mode = WAL;")
+            self._wal_applied = True
+        connection.execute("PRAGMA synchronous = NORMAL;")
+        connection.execute("PRAGMA cache_size = -65536;")
+        connection.execute("PRAGMA mmap_size = 268435456;")
+        connection.execute("PRAGMA temp_store = MEMORY;")
+        # Retry briefly on writer contention instead of failing with
+        # 'database is locked' when a seed job holds the write lock.
+        connection.execute("PRAGMA busy_timeout = 5000;")
         return connection
 
+    def _acquire_connection(self) -> sqlite3.Connection:
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            pass
+        with self._pool_lock:
+            if self._pool_connections_created < self._settings.db_pool_max_connections:
+                self._pool_connections_created += 1
+                return self._new_pooled_connection()
+        return self._pool.get()
+
+    @contextmanager
+    def get_connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a pooled connection and return it when the block exits.
+
+        Every repository method goes through here. Callers manage their own
+        transactions (explicit ``commit`` on writes); the pool only amortizes
+        connection setup. Beyond the pre-warmed minimum, connections are
+        created lazily up to the configured maximum.
+
+        Read-only methods deliberately do not wrap the borrowed connection in
+        sqlite3's ``with conn:`` transaction context: plain SELECTs leave the
+        connection in autocommit, so no COMMIT/ROLLBACK or journal touch
+        happens on the read path.
+        """
+        connection = self._acquire_connection()
+        try:
+            yield connection
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            self._pool.put(connection)
+
+    def close(self) -> None:
+        """Drain the pool, running ``PRAGMA optimize`` before each close.
+
+        `optimize` lets sqlite refresh its planner statistics where the query
+        history warrants it (nearly free when there is nothing to do), so the
+        next process start inherits plans tuned to the seeded data volume.
+        Connections still checked out are left to their borrowers; called from
+        application shutdown, after request traffic has stopped.
+        """
+        while True:
+            try:
+                connection = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                connection.execute("PRAGMA optimize;")
+            except sqlite3.Error:
+                logger.warning("PRAGMA optimize failed during shutdown", exc_info=True)
+            connection.close()
+        with self._pool_lock:
+            self._pool_connections_created = 0
+
     def _validate_probability_range(
         self,
         label: str,
@@ -125,28 +316,47 @@ class DataRepository:
 
     def _generate_synthetic_dataset_csv(self) -> None:
         self.synthetic_dataset_path.parent.mkdir(parents=True, exist_ok=True)
-        rng = random.Random(self._settings.synthetic_random_seed)
         end_date = datetime.strptime(
             self._settings.synthetic_reference_end_date,
             "%Y-%m-%d",
         ).date()
         start_date = end_date - timedelta(days=self._settings.synthetic_seed_days - 1)
 
+        days = self._settings.synthetic_seed_days
+        room_count = len(self._ROOM_CATALOG)
+        slot_count = len(self._settings.synthetic_time_slots)
+
+        # One seeded draw over the whole (days, rooms, slots) grid replaces
+        # the per-cell random.random() calls; deterministic via default_rng.
+        weekday_mask = np.fromiter(
+            ((start_date + timedelta(days=offset)).weekday() < 5 for offset in range(days)),
+            dtype=bool,
+            count=days,
+        )
+        day_probabilities = np.where(
+            weekday_mask,
+            self._settings.synthetic_weekday_occupied_probability,
+            self._settings.synthetic_weekend_occupied_probability,
+        )
+        rng = np.random.default_rng(self._settings.synthetic_random_seed)
+        occupied_grid = (
+            rng.random((days, room_count, slot_count))
+            < day_probabilities[:, None, None]
+        ).astype(np.int8)
+
+        day_labels = [
+            (start_date + timedelta(days=offset)).isoformat() for offset in range(days)
+        ]
         with self.synthetic_dataset_path.open("w", newline="", encoding="utf-8") as handle:
             writer = csv.writer(handle, lineterminator="\n")
             writer.writerow(self._SYNTHETIC_COLUMNS)
-
-            for offset in range(self._settings.synthetic_seed_days):
-                current_day = start_date + timedelta(days=offset)
-                occupied_probability = (
-                    self._settings.synthetic_weekday_occupied_probability
-                    if current_day.weekday() < 5
-                    else self._settings.synthetic_weekend_occupied_probability
-                )
+            occupied_cells = occupied_grid.reshape(-1).tolist()
+            cell = 0
+            for day_label in day_labels:
                 for room_id, *_ in self._ROOM_CATALOG:
                     for slot in self._settings.synthetic_time_slots:
-                        occupied = 1 if rng.random() < occupied_probability else 0
-                        writer.writerow([room_id, current_day.isoformat(), slot, occupied])
+                        writer.writerow([room_id, day_label, slot, occupied_cells[cell]])
+                        cell += 1
 
         logger.info(
             "Synthetic dataset generated at %s with %s rows",
@@ -254,7 +464,7 @@ class DataRepository:
             WHERE id BETWEEN 1 AND 10;
             """
         )
-        persisted_room_ids = {int(row["id"]) for row in cursor.fetchall()}
+        persisted_room_ids = {int(row["id"]) for row in cursor}
         missing_room_ids = sorted(expected_room_ids - persisted_room_ids)
         if missing_room_ids:
             raise RuntimeError(
@@ -265,9 +475,32 @@ class DataRepository:
     def initialize_database(self) -> None:
         """Create all persistence artifacts before API startup."""
         try:
-            with self._connect() as conn:
+            with self.get_connection() as conn:
                 cursor = conn.cursor()
 
+                # One-shot schema marker: when SchemaVersion already records
+                # the current version, the table/index DDL and the
+                # PRAGMA table_info column probes below cannot find anything
+                # to do, so skip them entirely. Bump SCHEMA_VERSION whenever
+                # the DDL in this method changes.
+                cursor.execute(
+                    """
+                    SELECT name FROM sqlite_master
+                    WHERE type = 'table' AND name = 'SchemaVersion';
+                    """
+                )
+                if cursor.fetchone() is not None:
+                    cursor.execute("SELECT MAX(version) AS version FROM SchemaVersion;")
+                    row = cursor.fetchone()
+                    if row is not None and row["version"] is not None:
+                        if int(row["version"]) >= self.SCHEMA_VERSION:
+                            logger.info(
+                                "Database schema at %s is current (v%s); skipping DDL",
+                                self._db_path,
+                                self.SCHEMA_VERSION,
+                            )
+                            return
+
                 cursor.execute(
                     """
                     CREATE TABLE IF NOT EXISTS Rooms (
@@ -367,10 +600,32 @@ class DataRepository:
                     """
                 )
 
+                # Covering index for the occupancy aggregates: appending
+                # `occupied` lets AVG(occupied) be answered from index pages
+                # alone, with no per-row fetch from the table B-tree.
+                # (Supersedes the narrower idx_booking_room_slot_date.)
+                cursor.execute("DROP INDEX IF EXISTS idx_booking_room_slot_date;")
+                cursor.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_booking_room_slot_date_occ
+                    ON BookingHistory(room_id, time_slot, date, occupied);
+                    """
+                )
+                # Matches the ORDER BY in get_booking_history_for_training so
+                # the full-history read is an index walk, not a temp-B-tree
+                # sort over every row.
+                cursor.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_booking_training
+                    ON BookingHistory(date, room_id, time_slot);
+                    """
+                )
+                # Serves SELECT DISTINCT time_slot straight from a sorted
+                # index instead of a full-table scan.
                 cursor.execute(
                     """
-                    CREATE INDEX IF NOT EXISTS idx_booking_room_slot_date
-                    ON BookingHistory(room_id, time_slot, date);
+                    CREATE INDEX IF NOT EXISTS idx_booking_slot
+                    ON BookingHistory(time_slot);
                     """
                 )
                 cursor.execute(
@@ -398,7 +653,7 @@ class DataRepository:
 
                 cursor.execute("PRAGMA table_info(Requests);")
                 request_columns = {
-                    str(row["name"]) for row in cursor.fetchall()
+                    str(row["name"]) for row in cursor
                 }
                 if "stakeholder_id" not in request_columns:
                     cursor.execute(
@@ -410,7 +665,7 @@ class DataRepository:
 
                 cursor.execute("PRAGMA table_info(ModelRegistry);")
                 registry_columns = {
-                    str(row["name"]) for row in cursor.fetchall()
+                    str(row["name"]) for row in cursor
                 }
                 if "training_rows" not in registry_columns:
                     cursor.execute(
@@ -419,6 +674,19 @@ class DataRepository:
                         ADD COLUMN training_rows INTEGER NOT NULL DEFAULT 0;
                         """
                     )
+
+                cursor.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS SchemaVersion (
+                        version INTEGER PRIMARY KEY
+                    );
+                    """
+                )
+                cursor.execute("DELETE FROM SchemaVersion;")
+                cursor.execute(
+                    "INSERT INTO SchemaVersion (version) VALUES (?);",
+                    (self.SCHEMA_VERSION,),
+                )
                 conn.commit()
             logger.info("Database initialized at %s", self._db_path)
         except sqlite3.Error as exc:
@@ -430,26 +698,61 @@ class DataRepository:
         self._ensure_synthetic_dataset_exists()
         booking_rows = self._load_synthetic_rows_from_csv()
         try:
-            with self._connect() as conn:
+            with self.get_connection() as conn:
                 cursor = conn.cursor()
                 self._seed_room_catalog(cursor)
+                conn.commit()
                 cursor.execute("SELECT COUNT(*) AS count FROM BookingHistory;")
                 before_count = int(cursor.fetchone()["count"])
-                cursor.executemany(
-                    """
-                    INSERT OR IGNORE INTO BookingHistory (
-                        room_id,
-                        date,
-                        time_slot,
-                        occupied
+                fresh_load = before_count == 0
+                if fresh_load:
+                    # Classic bulk-load shape: drop the secondary lookup
+                    # indexes so each inserted row updates one B-tree fewer,
+                    # load under an explicit write transaction, rebuild them
+                    # once at the end. The UNIQUE index stays live — INSERT OR
+                    # IGNORE dedup depends on it.
+                    cursor.execute("DROP INDEX IF EXISTS idx_booking_room_slot_date_occ;")
+                    cursor.execute("DROP INDEX IF EXISTS idx_booking_training;")
+                    cursor.execute("DROP INDEX IF EXISTS idx_booking_slot;")
+                    cursor.execute("BEGIN IMMEDIATE;")
+                for start in range(0, len(booking_rows), _SEED_INSERT_CHUNK_SIZE):
+                    chunk = booking_rows[start : start + _SEED_INSERT_CHUNK_SIZE]
+                    flat_params = [value for row in chunk for value in row]
+                    if len(chunk) == _SEED_INSERT_CHUNK_SIZE:
+                        cursor.execute(_SQL_SEED_INSERT_FULL_CHUNK, flat_params)
+                    else:
+                        # Final short chunk: one bespoke statement per seed run.
+                        cursor.execute(
+                            _SQL_SEED_INSERT_PREFIX
+                            + ",".join(["(?, ?, ?, ?)"] * len(chunk))
+                            + ";",
+                            flat_params,
+                        )
+                if fresh_load:
+                    cursor.execute(
+                        """
+                        CREATE INDEX IF NOT EXISTS idx_booking_room_slot_date_occ
+                        ON BookingHistory(room_id, time_slot, date, occupied);
+                        """
+                    )
+                    cursor.execute(
+                        """
+                        CREATE INDEX IF NOT EXISTS idx_booking_training
+                        ON BookingHistory(date, room_id, time_slot);
+                        """
+                    )
+                    cursor.execute(
+                        """
+                        CREATE INDEX IF NOT EXISTS idx_booking_slot
+                        ON BookingHistory(time_slot);
+                        """
                     )
-                    VALUES (?, ?, ?, ?);
-                    """,
-                    booking_rows,
-                )
                 cursor.execute("SELECT COUNT(*) AS count FROM BookingHistory;")
                 after_count = int(cursor.fetchone()["count"])
                 conn.commit()
+            # Seeding is the only BookingHistory writer; drop the cached
+            # whole-table aggregates so readers see the new rows immediately.
+            self._invalidate_aggregate_caches()
             inserted_count = after_count - before_count
             duplicate_count = max(len(booking_rows) - inserted_count, 0)
             logger.info(
@@ -498,7 +801,7 @@ class DataRepository:
         """Seed deterministic demo requests only when Requests is empty."""
         demo_rows = self._build_demo_requests()
         try:
-            with self._connect() as conn:
+            with self.get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("SELECT COUNT(*) AS count FROM Requests;")
                 existing_count = int(cursor.fetchone()["count"])
@@ -524,28 +827,62 @@ class DataRepository:
                 )
                 conn.commit()
                 inserted_count = len(demo_rows)
+            self._bump_pending_requests_version()
             logger.info("Seeded %s deterministic demo requests", inserted_count)
             return inserted_count
         except sqlite3.Error as exc:
             raise RuntimeError(f"Demo request seeding failed: {exc}") from exc
 
+    def get_seed_version(self) -> int:
+        """Read the seed marker stored in SQLite's user_version pragma."""
+        with self.get_connection() as conn:
+            return int(conn.execute("PRAGMA user_version;").fetchone()[0])
+
+    def set_seed_version(self, version: int) -> None:
+        """Record that seeding up to ``version`` has completed."""
+        with self.get_connection() as conn:
+            conn.execute(f"PRAGMA user_version = {int(version)};")
+            conn.commit()
+
     def get_room(self, room_id: int) -> Optional[RoomRecord]:
         """Fetch room metadata for validation and feature enrichment."""
-        with self._connect() as conn:
+        key = int(room_id)
+        with self._aggregate_cache_lock:
+            if key in self._room_cache:
+                return self._room_cache[key]
+        with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                "SELECT id, room_type FROM Rooms WHERE id = ?;",
-                (room_id,),
-            )
+            cursor.execute(_SQL_GET_ROOM, (key,))
             row = cursor.fetchone()
-            if row is None:
-                return None
-            return RoomRecord(room_id=int(row["id"]), room_type=str(row["room_type"]))
+        record = (
+            None
+            if row is None
+            else RoomRecord(room_id=int(row["id"]), room_type=str(row["room_type"]))
+        )
+        with self._aggregate_cache_lock:
+            self._room_cache[key] = record
+        return record
+
+    def warm_room_cache(self) -> None:
+        """Pre-load the full room catalog so get_room never misses at runtime."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            cursor.execute("SELECT id, room_type FROM Rooms;")
+            records = {
+                int(room_id): RoomRecord(room_id=int(room_id), room_type=room_type)
+                for room_id, room_type in cursor
+            }
+        with self._aggregate_cache_lock:
+            self._room_cache.update(records)
 
-    def get_booking_history_for_training(self) -> List[BookingRecord]:
+    def get_booking_history_for_training(self) -> BookingColumns:
         """Load historical occupancy joined with room_type for model training."""
-        with self._connect() as conn:
+        with self.get_connection() as conn:
             cursor = conn.cursor()
+            # Plain tuples: sqlite3.Row's keyed access costs a dict probe per
+            # column, which adds up over the full history scan.
+            cursor.row_factory = None
             cursor.execute(
                 """
                 SELECT
@@ -559,16 +896,29 @@ class DataRepository:
                 ORDER BY bh.date ASC, bh.room_id ASC, bh.time_slot ASC;
                 """
             )
-            return [
-                BookingRecord(
-                    room_id=int(row["room_id"]),
-                    date=str(row["date"]),
-                    time_slot=str(row["time_slot"]),
-                    occupied=int(row["occupied"]),
-                    room_type=str(row["room_type"]),
-                )
-                for row in cursor.fetchall()
-            ]
+            rows = cursor.fetchall()
+        row_count = len(rows)
+        room_ids = np.empty(row_count, dtype=np.int64)
+        dates = np.empty(row_count, dtype=object)
+        time_slots = np.empty(row_count, dtype=object)
+        occupied = np.empty(row_count, dtype=np.int64)
+        room_types = np.empty(row_count, dtype=object)
+        # Dates, slots, and room types come from tiny fixed vocabularies that
+        # repeat across thousands of rows; interning them lets later
+        # dict/group-by lookups short-circuit on pointer equality.
+        for index, (room_id, date_value, time_slot, occupied_flag, room_type) in enumerate(rows):
+            room_ids[index] = room_id
+            dates[index] = sys.intern(date_value)
+            time_slots[index] = sys.intern(time_slot)
+            occupied[index] = occupied_flag
+            room_types[index] = sys.intern(room_type)
+        return BookingColumns(
+            room_id=room_ids,
+            date=dates,
+            time_slot=time_slots,
+            occupied=occupied,
+            room_type=room_types,
+        )
 
     def get_historical_occupancy_frequency(
         self,
@@ -576,16 +926,9 @@ class DataRepository:
         time_slot: str,
     ) -> Optional[float]:
         """Return long-run occupancy frequency for room/slot pair."""
-        with self._connect() as conn:
+        with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                """
-                SELECT AVG(occupied) AS avg_occupied
-                FROM BookingHistory
-                WHERE room_id = ? AND time_slot = ?;
-                """,
-                (room_id, time_slot),
-            )
+            cursor.execute(_SQL_HISTORICAL_OCCUPANCY, (room_id, time_slot))
             row = cursor.fetchone()
             if row is None or row["avg_occupied"] is None:
                 return None
@@ -599,17 +942,10 @@ class DataRepository:
         window_days: int,
     ) -> Optional[float]:
         """Return the mean occupancy of the trailing `window_days` period."""
-        with self._connect() as conn:
+        with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
-                """
-                SELECT AVG(occupied) AS rolling_avg
-                FROM BookingHistory
-                WHERE room_id = ?
-                  AND time_slot = ?
-                  AND date < ?
-                  AND date >= date(?, ?);
-                """,
+                _SQL_ROLLING_OCCUPANCY,
                 (room_id, time_slot, target_date, target_date, f"-{window_days} day"),
             )
             row = cursor.fetchone()
@@ -617,25 +953,116 @@ class DataRepository:
                 return None
             return float(row["rolling_avg"])
 
+    def get_historical_occupancy_frequencies(self, time_slot: str) -> dict[int, float]:
+        """Return long-run occupancy frequency per room for one time slot.
+
+        One grouped scan instead of a query per room; batch prediction reads
+        the whole slot anyway, so rooms outside the caller's roster cost
+        nothing extra.
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            cursor.execute(_SQL_HISTORICAL_OCCUPANCY_BY_ROOM, (time_slot,))
+            return {
+                int(room_id): float(avg_occupied)
+                for room_id, avg_occupied in cursor
+                if avg_occupied is not None
+            }
+
+    def get_rolling_occupancy_averages(
+        self,
+        time_slot: str,
+        target_date: str,
+        window_days: int,
+    ) -> dict[int, float]:
+        """Return the trailing-window occupancy mean per room for one slot."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            cursor.execute(
+                _SQL_ROLLING_OCCUPANCY_BY_ROOM,
+                (time_slot, target_date, target_date, f"-{window_days} day"),
+            )
+            return {
+                int(room_id): float(rolling_avg)
+                for room_id, rolling_avg in cursor
+                if rolling_avg is not None
+            }
+
+    def _invalidate_aggregate_caches(self) -> None:
+        with self._aggregate_cache_lock:
+            self._global_occupancy_cache = None
+            self._known_slots_cache = None
+            self._room_cache.clear()
+
+    @property
+    def pending_requests_version(self) -> int:
+        """Current revision of the Requests table within this process."""
+        with self._aggregate_cache_lock:
+            return self._pending_requests_version
+
+    def _bump_pending_requests_version(self) -> None:
+        with self._aggregate_cache_lock:
+            self._pending_requests_version += 1
+
     def get_global_occupancy_frequency(self) -> float:
         """Return system-wide occupancy baseline for sparse-history fallback."""
-        with self._connect() as conn:
+        now = time.monotonic()
+        with self._aggregate_cache_lock:
+            cached = self._global_occupancy_cache
+            if cached is not None and now - cached[1] < self._aggregate_cache_ttl_seconds:
+                return cached[0]
+        with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT AVG(occupied) AS avg_occupied FROM BookingHistory;")
             row = cursor.fetchone()
             if row is None or row["avg_occupied"] is None:
-                return self._settings.prediction_default_occupancy_probability
-            return float(row["avg_occupied"])
+                frequency = self._settings.prediction_default_occupancy_probability
+            else:
+                frequency = float(row["avg_occupied"])
+        with self._aggregate_cache_lock:
+            self._global_occupancy_cache = (frequency, now)
+        return frequency
 
     def list_known_time_slots(self) -> Sequence[str]:
         """Return configured or historical slots to support input validation."""
-        with self._connect() as conn:
+        now = time.monotonic()
+        with self._aggregate_cache_lock:
+            cached = self._known_slots_cache
+            if cached is not None and now - cached[1] < self._aggregate_cache_ttl_seconds:
+                return cached[0]
+        with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT DISTINCT time_slot FROM BookingHistory;")
-            slots = [str(row["time_slot"]) for row in cursor.fetchall()]
+            # idx_booking_slot lets sqlite walk distinct values in order, so
+            # dedup and sort both happen inside the index traversal.
+            cursor.execute(
+                "SELECT DISTINCT time_slot FROM BookingHistory ORDER BY time_slot;"
+            )
+            slots = [str(row["time_slot"]) for row in cursor]
         if slots:
-            return tuple(sorted(slots))
-        return self._settings.synthetic_time_slots
+            result = tuple(slots)
+        else:
+            result = tuple(self._settings.synthetic_time_slots)
+        with self._aggregate_cache_lock:
+            self._known_slots_cache = (result, now)
+        return result
+
+    def save_predictions(
+        self,
+        rows: Iterable[tuple[int, str, str, float]],
+    ) -> None:
+        """Persist a batch of (room_id, date, time_slot, idle_probability) rows.
+
+        One executemany in one transaction: batch callers pay a single commit
+        (and fsync) instead of one per prediction.
+        """
+        prediction_rows = list(rows)
+        if not prediction_rows:
+            return
+        with self.get_connection() as conn:
+            conn.executemany(_SQL_SAVE_PREDICTION, prediction_rows)
+            conn.commit()
 
     def save_prediction(
         self,
@@ -645,26 +1072,17 @@ class DataRepository:
         idle_probability: float,
     ) -> None:
         """Persist inference output for debugging and observability."""
-        with self._connect() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                INSERT INTO Predictions (room_id, date, time_slot, idle_probability)
-                VALUES (?, ?, ?, ?);
-                """,
-                (room_id, date, time_slot, idle_probability),
-            )
-            conn.commit()
+        self.save_predictions([(room_id, date, time_slot, idle_probability)])
 
     def count_predictions(self) -> int:
         """Return persisted prediction count for diagnostics and tests."""
-        with self._connect() as conn:
+        with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT COUNT(*) AS count FROM Predictions;")
             return int(cursor.fetchone()["count"])
 
     def count_requests(self) -> int:
-        with self._connect() as conn:
+        with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT COUNT(*) AS count FROM Requests;")
             return int(cursor.fetchone()["count"])
@@ -673,7 +1091,7 @@ class DataRepository:
         self,
         limit: int = 20,
     ) -> list[tuple[str, str, int]]:
-        with self._connect() as conn:
+        with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """
@@ -692,13 +1110,16 @@ class DataRepository:
                     str(row["requested_time_slot"]),
                     int(row["request_count"]),
                 )
-                for row in cursor.fetchall()
+                for row in cursor
             ]
 
     def list_rooms_for_allocation(self) -> list[Room]:
         """Return room capacities for allocation optimization."""
-        with self._connect() as conn:
+        with self.get_connection() as conn:
             cursor = conn.cursor()
+            # Tuple rows: one C-level unpack per row instead of a name lookup
+            # per column through sqlite3.Row.__getitem__.
+            cursor.row_factory = None
             cursor.execute(
                 """
                 SELECT id, capacity
@@ -707,11 +1128,8 @@ class DataRepository:
                 """
             )
             return [
-                Room(
-                    room_id=int(row["id"]),
-                    capacity=int(row["capacity"]),
-                )
-                for row in cursor.fetchall()
+                Room(room_id=int(room_id), capacity=int(capacity))
+                for room_id, capacity in cursor
             ]
 
     def list_pending_requests(
@@ -720,8 +1138,9 @@ class DataRepository:
         requested_time_slot: str,
     ) -> list[AllocationRequest]:
         """Return pending requests eligible for the target date/slot."""
-        with self._connect() as conn:
+        with self.get_connection() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = None
             cursor.execute(
                 """
                 SELECT
@@ -741,20 +1160,28 @@ class DataRepository:
             )
             return [
                 AllocationRequest(
-                    request_id=int(row["id"]),
-                    requested_capacity=int(row["requested_capacity"]),
-                    requested_date=str(row["requested_date"]),
-                    requested_time_slot=str(row["requested_time_slot"]),
-                    priority_weight=float(row["priority_weight"]),
-                    stakeholder_id=str(row["stakeholder_id"]),
+                    request_id=int(request_id),
+                    requested_capacity=int(requested_capacity),
+                    requested_date=sys.intern(requested_date),
+                    requested_time_slot=sys.intern(requested_time_slot),
+                    priority_weight=float(priority_weight),
+                    stakeholder_id=sys.intern(stakeholder_id),
                 )
-                for row in cursor.fetchall()
+                for (
+                    request_id,
+                    requested_capacity,
+                    requested_date,
+                    requested_time_slot,
+                    priority_weight,
+                    stakeholder_id,
+                ) in cursor
             ]
 
     def list_all_pending_requests(self) -> list[AllocationRequest]:
         """Return all pending requests across dates/slots in deterministic order."""
-        with self._connect() as conn:
+        with self.get_connection() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = None
             cursor.execute(
                 """
                 SELECT
@@ -771,14 +1198,21 @@ class DataRepository:
             )
             return [
                 AllocationRequest(
-                    request_id=int(row["id"]),
-                    requested_capacity=int(row["requested_capacity"]),
-                    requested_date=str(row["requested_date"]),
-                    requested_time_slot=str(row["requested_time_slot"]),
-                    priority_weight=float(row["priority_weight"]),
-                    stakeholder_id=str(row["stakeholder_id"]),
+                    request_id=int(request_id),
+                    requested_capacity=int(requested_capacity),
+                    requested_date=sys.intern(requested_date),
+                    requested_time_slot=sys.intern(requested_time_slot),
+                    priority_weight=float(priority_weight),
+                    stakeholder_id=sys.intern(stakeholder_id),
                 )
-                for row in cursor.fetchall()
+                for (
+                    request_id,
+                    requested_capacity,
+                    requested_date,
+                    requested_time_slot,
+                    priority_weight,
+                    stakeholder_id,
+                ) in cursor
             ]
 
     def list_idle_predictions(
@@ -787,31 +1221,40 @@ class DataRepository:
         requested_time_slot: str,
     ) -> list[IdlePrediction]:
         """Return latest idle predictions per room for a date/slot."""
-        with self._connect() as conn:
+        with self.get_connection() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = None
+            # Single window-function scan: the old MAX(id) self-join walked
+            # Predictions twice and materialized the GROUP BY; ROW_NUMBER()
+            # keeps the latest row per room in one index range-scan.
             cursor.execute(
                 """
-                SELECT p.room_id, p.date, p.time_slot, p.idle_probability
-                FROM Predictions AS p
-                INNER JOIN (
-                    SELECT room_id, date, time_slot, MAX(id) AS max_id
+                SELECT room_id, date, time_slot, idle_probability
+                FROM (
+                    SELECT
+                        room_id,
+                        date,
+                        time_slot,
+                        idle_probability,
+                        ROW_NUMBER() OVER (
+                            PARTITION BY room_id ORDER BY id DESC
+                        ) AS rn
                     FROM Predictions
                     WHERE date = ? AND time_slot = ?
-                    GROUP BY room_id, date, time_slot
-                ) AS latest
-                    ON latest.max_id = p.id
-                ORDER BY p.room_id ASC;
+                )
+                WHERE rn = 1
+                ORDER BY room_id ASC;
                 """,
                 (requested_date, requested_time_slot),
             )
             return [
                 IdlePrediction(
-                    room_id=int(row["room_id"]),
-                    date=str(row["date"]),
-                    time_slot=str(row["time_slot"]),
-                    idle_probability=float(row["idle_probability"]),
+                    room_id=int(room_id),
+                    date=sys.intern(date_value),
+                    time_slot=sys.intern(time_slot),
+                    idle_probability=float(idle_probability),
                 )
-                for row in cursor.fetchall()
+                for room_id, date_value, time_slot, idle_probability in cursor
             ]
 
     def save_forecast_output(
@@ -822,7 +1265,7 @@ class DataRepository:
         """Persist demand forecasts for auditability/debugging."""
         if not forecasts:
             return
-        with self._connect() as conn:
+        with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.executemany(
                 """
@@ -846,6 +1289,31 @@ class DataRepository:
             )
             conn.commit()
 
+    def _insert_allocation_logs(
+        self,
+        cursor: sqlite3.Cursor,
+        allocation_rows: Sequence[tuple[int, int, float]],
+    ) -> None:
+        cursor.executemany(
+            """
+            INSERT INTO AllocationLogs (request_id, room_id, allocation_score)
+            VALUES (?, ?, ?);
+            """,
+            allocation_rows,
+        )
+
+    def _update_request_statuses(
+        self,
+        cursor: sqlite3.Cursor,
+        request_ids: Sequence[int],
+    ) -> None:
+        ids = [int(request_id) for request_id in request_ids]
+        for start in range(0, len(ids), _MARK_ALLOCATED_CHUNK_SIZE):
+            chunk = ids[start : start + _MARK_ALLOCATED_CHUNK_SIZE]
+            if len(chunk) < _MARK_ALLOCATED_CHUNK_SIZE:
+                chunk.extend([chunk[-1]] * (_MARK_ALLOCATED_CHUNK_SIZE - len(chunk)))
+            cursor.execute(_SQL_MARK_ALLOCATED, chunk)
+
     def save_allocation_logs(
         self,
         allocations: Iterable[tuple[int, int, float]],
@@ -854,33 +1322,42 @@ class DataRepository:
         allocation_rows = list(allocations)
         if not allocation_rows:
             return
-        with self._connect() as conn:
-            cursor = conn.cursor()
-            cursor.executemany(
-                """
-                INSERT INTO AllocationLogs (request_id, room_id, allocation_score)
-                VALUES (?, ?, ?);
-                """,
-                allocation_rows,
-            )
+        with self.get_connection() as conn:
+            self._insert_allocation_logs(conn.cursor(), allocation_rows)
             conn.commit()
 
     def mark_requests_allocated(self, request_ids: Sequence[int]) -> None:
         """Mark allocated request ids for stateful request lifecycle tracking."""
         if not request_ids:
             return
-        placeholders = ",".join("?" for _ in request_ids)
-        with self._connect() as conn:
+        with self.get_connection() as conn:
+            self._update_request_statuses(conn.cursor(), request_ids)
+            conn.commit()
+        self._bump_pending_requests_version()
+
+    def finalize_allocations(
+        self,
+        allocations: Sequence[tuple[int, int, float]],
+        request_ids: Sequence[int],
+    ) -> None:
+        """Log allocations and flip request statuses under a single commit.
+
+        Finalization needs both writes or neither: committing them separately
+        could leave allocations logged with their requests still PENDING after
+        a crash, and pays two fsyncs where one suffices.
+        """
+        allocation_rows = list(allocations)
+        if not allocation_rows and not request_ids:
+            return
+        with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                f"""
-                UPDATE Requests
-                SET status = 'ALLOCATED'
-                WHERE id IN ({placeholders});
-                """,
-                tuple(request_ids),
-            )
+            if allocation_rows:
+                self._insert_allocation_logs(cursor, allocation_rows)
+            if request_ids:
+                self._update_request_statuses(cursor, request_ids)
             conn.commit()
+        if request_ids:
+            self._bump_pending_requests_version()
 
     def get_historical_request_counts_by_time_slot(
         self,
@@ -888,22 +1365,28 @@ class DataRepository:
         target_date: str,
     ) -> dict[str, int]:
         """Aggregate request frequencies by slot for forecasting baseline."""
-        with self._connect() as conn:
+        # Computing the lower bound here (instead of sqlite's date() scalar)
+        # gives the planner two literal bounds, so the leading requested_date
+        # column of idx_requests_date_slot_status serves a pure range seek.
+        lower_bound = (
+            datetime.strptime(target_date, "%Y-%m-%d") - timedelta(days=lookback_days)
+        ).strftime("%Y-%m-%d")
+        with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """
                 SELECT requested_time_slot AS time_slot, COUNT(*) AS count
                 FROM Requests
                 WHERE requested_date < ?
-                  AND requested_date >= date(?, ?)
+                  AND requested_date >= ?
                 GROUP BY requested_time_slot
                 ORDER BY requested_time_slot ASC;
                 """,
-                (target_date, target_date, f"-{lookback_days} day"),
+                (target_date, lower_bound),
             )
             return {
                 str(row["time_slot"]): int(row["count"])
-                for row in cursor.fetchall()
+                for row in cursor
             }
 
     def create_request(
@@ -915,7 +1398,7 @@ class DataRepository:
         stakeholder_id: str,
     ) -> int:
         """Insert request row and return the created id."""
-        with self._connect() as conn:
+        with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """
@@ -937,27 +1420,26 @@ class DataRepository:
                 ),
             )
             conn.commit()
-            return int(cursor.lastrowid)
+            created_id = int(cursor.lastrowid)
+        self._bump_pending_requests_version()
+        return created_id
 
     def count_allocation_logs(self) -> int:
-        with self._connect() as conn:
+        with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT COUNT(*) AS count FROM AllocationLogs;")
             return int(cursor.fetchone()["count"])
 
     def count_forecast_logs(self) -> int:
-        with self._connect() as conn:
+        with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT COUNT(*) AS count FROM DemandForecastLogs;")
             return int(cursor.fetchone()["count"])
 
     def get_request_status(self, request_id: int) -> Optional[str]:
-        with self._connect() as conn:
+        with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                "SELECT status FROM Requests WHERE id = ?;",
-                (request_id,),
-            )
+            cursor.execute(_SQL_GET_REQUEST_STATUS, (request_id,))
             row = cursor.fetchone()
             if row is None:
                 return None
@@ -971,7 +1453,7 @@ class DataRepository:
         trained_at: str,
         training_rows: int,
     ) -> None:
-        with self._connect() as conn:
+        with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """
@@ -990,7 +1472,7 @@ class DataRepository:
             conn.commit()
 
     def get_model_metadata(self) -> Optional[dict[str, str | int]]:
-        with self._connect() as conn:
+        with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import hashlib
 import secrets
+import time
 from typing import Optional
 
 from backend.utils.config import Settings, get_settings
@@ -23,32 +25,63 @@ class InvalidAdminTokenError(AuthenticationError):
 class AuthService:
     """Validates login credentials and bearer tokens."""
 
+    # Sessions expire after an hour of existence; logins are cheap enough
+    # that operators can simply re-authenticate.
+    _SESSION_TTL_SECONDS = 3600.0
+
     def __init__(self, settings: Optional[Settings] = None) -> None:
         self._settings = settings or get_settings()
-        self._session_token: str | None = None
+        # Encoded once: compare_digest on bytes takes the direct memcmp-style
+        # path, while str arguments go through the slower unicode route and
+        # re-encode per call.
+        admin_token = self._settings.admin_token
+        self._expected_token_bytes: bytes | None = (
+            admin_token.encode("utf-8") if admin_token else None
+        )
+        # Active sessions keyed by a 16-byte blake2b digest of the token,
+        # mapping to expiry time. Hash-keyed lookup means validation never
+        # scans stored tokens, and several admins can hold sessions at once
+        # instead of each login evicting the previous one.
+        self._sessions: dict[bytes, float] = {}
 
     @property
     def auth_enabled(self) -> bool:
-        return bool(self._settings.admin_token)
+        return self._expected_token_bytes is not None
 
-    def _expected_token(self) -> str:
-        if not self._settings.admin_token:
+    def _expected_token(self) -> bytes:
+        if self._expected_token_bytes is None:
             raise AdminTokenNotConfiguredError(
                 "ADMIN_TOKEN is not configured. Set ADMIN_TOKEN in environment variables."
             )
-        return self._settings.admin_token
+        return self._expected_token_bytes
+
+    @staticmethod
+    def _token_digest(token: str) -> bytes:
+        return hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+
+    def _prune_expired_sessions(self, now: float) -> None:
+        expired = [digest for digest, expiry in self._sessions.items() if expiry <= now]
+        for digest in expired:
+            del self._sessions[digest]
 
     def login(self, provided_admin_token: str) -> str:
         expected = self._expected_token()
-        if not secrets.compare_digest(provided_admin_token, expected):
+        if not secrets.compare_digest(provided_admin_token.encode("utf-8"), expected):
             raise InvalidAdminTokenError("Invalid admin token")
-        self._session_token = secrets.token_urlsafe(32)
-        return self._session_token
+        now = time.monotonic()
+        self._prune_expired_sessions(now)
+        session_token = secrets.token_urlsafe(32)
+        self._sessions[self._token_digest(session_token)] = now + self._SESSION_TTL_SECONDS
+        return session_token
 
     def validate_bearer_token(self, bearer_token: str) -> None:
         if not self.auth_enabled:
             return
-        if self._session_token is None:
+        if not self._sessions:
             raise InvalidAdminTokenError("No active session. Login first.")
-        if not secrets.compare_digest(bearer_token, self._session_token):
+        expiry = self._sessions.get(self._token_digest(bearer_token))
+        if expiry is None:
             raise InvalidAdminTokenError("Invalid bearer token")
+        if expiry <= time.monotonic():
+            del self._sessions[self._token_digest(bearer_token)]
+            raise InvalidAdminTokenError("Session expired. Login again.")
@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from threading import RLock
+import time
+from dataclasses import dataclass, field
+from threading import Event, RLock, Thread
 from typing import Any, Optional
 
+from backend.domain.models import DemandForecast, OptimizationResult
 from backend.repository.data_repository import DataRepository
 from backend.services.matching_service import AllocationOptimizationService
 from backend.services.prediction_service import AvailabilityPredictionService
 from backend.services.simulation_service import SimulationService, TemporaryConstraints
 from backend.utils.config import Settings, get_settings
+from backend.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
 
 
 class DashboardValidationError(Exception):
@@ -27,11 +33,20 @@ class AllocationDraft:
     requested_time_slot: str
     idle_probability_threshold: float | None
     stakeholder_usage_cap: float | None
+    # Solved preview outputs, cached so approve persists instead of paying a
+    # second identical CP-SAT solve.
+    result: OptimizationResult | None = None
+    forecasts: list[DemandForecast] = field(default_factory=list)
+    created_at: float = 0.0
 
 
 class DashboardWorkflowService:
     """Coordinates predict -> allocate -> simulate -> approve flow."""
 
+    # Previews older than this are re-solved on approve rather than trusted,
+    # since pending requests may have changed underneath them.
+    _DRAFT_TTL_SECONDS = 600.0
+
     def __init__(
         self,
         repository: Optional[DataRepository] = None,
@@ -59,6 +74,48 @@ class DashboardWorkflowService:
         self._lock = RLock()
         self._latest_metrics: dict[str, float] | None = None
         self._pending_allocation_draft: AllocationDraft | None = None
+        # Sorted pending-request stakeholders, valid while the repository's
+        # request revision is unchanged; what-if simulations re-derive the
+        # same set repeatedly otherwise.
+        self._stakeholders_cache: tuple[int, tuple[str, ...]] | None = None
+        self._metrics_ready = Event()
+        self._warmup_started = False
+
+    def start_metrics_warmup(self) -> None:
+        """Warm the metrics cache off the caller's thread.
+
+        Called from the app startup sequence once seeding and model training
+        have finished, so the first /metrics request is a dict read instead of
+        two CP-SAT solves. Starting this from ``__init__`` would race the cold
+        -boot seeders: the simulation would hit an empty schema ("no such
+        table: Rooms") or, worse, cache metrics computed from half-seeded
+        data. Idempotent; extra calls are ignored.
+        """
+        with self._lock:
+            if self._warmup_started:
+                return
+            self._warmup_started = True
+        Thread(
+            target=self._warm_metrics,
+            name="dashboard-metrics-warmup",
+            daemon=True,
+        ).start()
+
+    def _warm_metrics(self) -> None:
+        try:
+            self.run_simulation(
+                idle_probability_threshold=None,
+                stakeholder_usage_cap=None,
+                stakeholder_priority_weight=None,
+                capacity_override=None,
+                priority_adjustment=None,
+            )
+        except Exception:
+            # Warmup is best-effort: the synchronous fallback in get_metrics
+            # still covers the first caller if this fails.
+            logger.warning("Metrics warmup failed; first /metrics call will compute", exc_info=True)
+        finally:
+            self._metrics_ready.set()
 
     def predict_idle_probabilities(
         self,
@@ -72,23 +129,27 @@ class DashboardWorkflowService:
         else:
             unique_room_ids = [room.room_id for room in self._repository.list_rooms_for_allocation()]
 
-        prediction_rows: list[dict[str, float | int | str]] = []
-        for room_id in unique_room_ids:
-            prediction = self._prediction_service.predict(
-                room_id=room_id,
-                date=target_date,
-                time_slot=target_time_slot,
-                persist=True,
-            )
-            prediction_rows.append(
-                {
-                    "room_id": room_id,
-                    "date": target_date,
-                    "time_slot": target_time_slot,
-                    "predicted_idle_probability": float(prediction["idle_probability"]),
-                    "confidence_score": float(prediction["confidence_score"]),
-                }
-            )
+        # One batched inference call: feature queries, the model invocation,
+        # and the persistence transaction are all amortized across the roster
+        # instead of paid per room. A thread pool over per-room predict()
+        # would gain nothing here — predictions serialize on the service's
+        # model lock, and the batch already collapses the I/O.
+        predictions = self._prediction_service.predict_batch(
+            room_ids=unique_room_ids,
+            date=target_date,
+            time_slot=target_time_slot,
+            persist=True,
+        )
+        prediction_rows: list[dict[str, float | int | str]] = [
+            {
+                "room_id": room_id,
+                "date": target_date,
+                "time_slot": target_time_slot,
+                "predicted_idle_probability": float(prediction["idle_probability"]),
+                "confidence_score": float(prediction["confidence_score"]),
+            }
+            for room_id, prediction in predictions.items()
+        ]
 
         return {"predictions": prediction_rows}
 
@@ -100,16 +161,13 @@ class DashboardWorkflowService:
         idle_probability_threshold: float | None,
         stakeholder_usage_cap: float | None,
     ) -> dict[str, Any]:
-        result = self._matching_service.optimize_allocation(
+        # The solve already listed the pending requests; reusing them here
+        # avoids a second repository round-trip per preview.
+        result, forecasts, requests = self._matching_service.preview_allocation_outputs(
             requested_date=requested_date,
             requested_time_slot=requested_time_slot,
             idle_probability_threshold=idle_probability_threshold,
             stakeholder_usage_cap=stakeholder_usage_cap,
-            persist_outputs=False,
-        )
-        requests = self._repository.list_pending_requests(
-            requested_date=requested_date,
-            requested_time_slot=requested_time_slot,
         )
         request_by_id = {request.request_id: request for request in requests}
 
@@ -150,6 +208,9 @@ class DashboardWorkflowService:
                 requested_time_slot=requested_time_slot,
                 idle_probability_threshold=idle_probability_threshold,
                 stakeholder_usage_cap=stakeholder_usage_cap,
+                result=result,
+                forecasts=forecasts,
+                created_at=time.monotonic(),
             )
 
         return {
@@ -164,19 +225,37 @@ class DashboardWorkflowService:
         stakeholder_priority_weight: float | None,
         explicit_priority_adjustment: dict[str, float] | None,
     ) -> dict[str, float] | None:
-        adjustments = dict(explicit_priority_adjustment or {})
-        if stakeholder_priority_weight is not None:
-            if stakeholder_priority_weight <= 0.0:
-                raise DashboardValidationError("stakeholder_priority_weight must be > 0")
-            stakeholders = sorted(
-                {
-                    request.stakeholder_id
-                    for request in self._repository.list_all_pending_requests()
-                }
+        base = explicit_priority_adjustment or {}
+        if stakeholder_priority_weight is None:
+            return dict(base) or None
+        if stakeholder_priority_weight <= 0.0:
+            raise DashboardValidationError("stakeholder_priority_weight must be > 0")
+        # Version is read before the query so a write racing the refresh
+        # can only make the cached entry stale-marked, never wrong.
+        version = self._repository.pending_requests_version
+        with self._lock:
+            cached = self._stakeholders_cache
+        if cached is not None and cached[0] == version:
+            stakeholders = cached[1]
+        else:
+            stakeholders = tuple(
+                sorted(
+                    {
+                        request.stakeholder_id
+                        for request in self._repository.list_all_pending_requests()
+                    }
+                )
             )
-            for stakeholder in stakeholders:
-                current = adjustments.get(stakeholder, 1.0)
-                adjustments[stakeholder] = float(current * stakeholder_priority_weight)
+            with self._lock:
+                self._stakeholders_cache = (version, stakeholders)
+        # Batch merge: scaled entries for pending stakeholders plus untouched
+        # explicit extras, built in two comprehensions instead of per-key
+        # get/store round-trips on a growing dict.
+        stakeholder_set = set(stakeholders)
+        adjustments = {
+            stakeholder: float(base.get(stakeholder, 1.0) * stakeholder_priority_weight)
+            for stakeholder in stakeholders
+        } | {key: value for key, value in base.items() if key not in stakeholder_set}
         return adjustments or None
 
     def _to_metrics_payload(self, simulation_result: dict[str, Any]) -> dict[str, float]:
@@ -229,13 +308,26 @@ class DashboardWorkflowService:
                 "No allocation draft found. Run /allocate before /approve."
             )
 
-        result = self._matching_service.optimize_allocation(
-            requested_date=draft.requested_date,
-            requested_time_slot=draft.requested_time_slot,
-            idle_probability_threshold=draft.idle_probability_threshold,
-            stakeholder_usage_cap=draft.stakeholder_usage_cap,
-            persist_outputs=True,
-        )
+        draft_age = time.monotonic() - draft.created_at
+        if draft.result is not None and draft_age <= self._DRAFT_TTL_SECONDS:
+            # Fresh preview: persist the cached solve instead of re-running
+            # the CP-SAT model on identical inputs.
+            result = draft.result
+            self._matching_service.persist_allocation_outputs(
+                requested_date=draft.requested_date,
+                forecasts=draft.forecasts,
+                result=result,
+            )
+        else:
+            # Stale or legacy draft: the pending-request set may have drifted,
+            # so solve again with persistence enabled.
+            result = self._matching_service.optimize_allocation(
+                requested_date=draft.requested_date,
+                requested_time_slot=draft.requested_time_slot,
+                idle_probability_threshold=draft.idle_probability_threshold,
+                stakeholder_usage_cap=draft.stakeholder_usage_cap,
+                persist_outputs=True,
+            )
         with self._lock:
             self._pending_allocation_draft = None
         return {
@@ -246,6 +338,13 @@ class DashboardWorkflowService:
         }
 
     def get_metrics(self) -> dict[str, float]:
+        with self._lock:
+            if self._latest_metrics is not None:
+                return dict(self._latest_metrics)
+        # Give an in-flight warmup a brief chance to land before paying for
+        # a synchronous solve.
+        if self._warmup_started:
+            self._metrics_ready.wait(timeout=0.05)
         with self._lock:
             if self._latest_metrics is not None:
                 return dict(self._latest_metrics)
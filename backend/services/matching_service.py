@@ -3,17 +3,34 @@
 from __future__ import annotations
 
 import math
+import os
+import queue
+import re
+import threading
 from collections import Counter, defaultdict
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from typing import Any, Optional
 
+import numpy as np
+
+try:
+    from scipy.optimize import linear_sum_assignment
+except ModuleNotFoundError:  # pragma: no cover - runtime dependency guard
+    linear_sum_assignment = None  # type: ignore[assignment]
+
 try:
     from ortools.sat.python import cp_model
 except ModuleNotFoundError:  # pragma: no cover - runtime dependency guard
     cp_model = None  # type: ignore[assignment]
 
-from backend.domain.constraints import AllocationConfig, validate_allocation_config
+from backend.domain.constraints import (
+    AllocationConfig,
+    allocation_config_from,
+    validate_allocation_config,
+)
+from backend.domain.registry import StakeholderRegistry
+from backend.domain.timekeys import date_to_days, pack_time_key
 from backend.domain.models import (
     AllocationDecision,
     AllocationRequest,
@@ -59,20 +76,74 @@ def _ensure_solver_dependency() -> None:
         )
 
 
+def _resolve_worker_count(workers: int) -> int:
+    """Resolve ``cp_sat_workers`` with 0 meaning auto-size to host cores.
+
+    CP-SAT's portfolio is tuned around 16 workers (the first few run generic
+    strategies, the rest LNS), so auto caps there rather than grabbing every
+    core on large hosts.
+    """
+    if workers > 0:
+        return workers
+    return min(16, os.cpu_count() or 1)
+
+
+@lru_cache(maxsize=8)
+def _solver_parameters(
+    max_time_seconds: int,
+    workers: int,
+    seed: int,
+) -> Any:
+    """Build and cache one solver parameter block per distinct configuration.
+
+    Assigning parameter fields through the Python bindings costs a
+    binding-layer write per field per solve; caching a filled block and
+    bulk-copying it into each solver pays that cost once per configuration.
+    """
+    parameters = cp_model.CpSolver().parameters
+    parameters.max_time_in_seconds = float(max_time_seconds)
+    parameters.num_search_workers = workers
+    parameters.random_seed = seed
+    # Rooms with equal capacity are interchangeable in the assignment model;
+    # aggressive symmetry detection lets the solver prune the equivalent
+    # permutations instead of exploring them.
+    parameters.symmetry_level = 2
+    if workers > 1:
+        # Let parallel workers exchange learned binary clauses and root-level
+        # bounds — the portfolio's main source of super-linear speedup.
+        parameters.share_binary_clauses = True
+        parameters.share_level_zero_bounds = True
+        # Deterministic interleaving keeps multi-worker portfolio runs
+        # reproducible for a fixed seed while still engaging LNS workers.
+        parameters.interleave_search = True
+    return parameters
+
+
+def _apply_solver_parameters(solver: Any, parameters: Any) -> None:
+    copy = getattr(solver.parameters, "copy_from", None)
+    if copy is None:  # protobuf-based bindings spell it CopyFrom
+        copy = solver.parameters.CopyFrom
+    copy(parameters)
+
+
+# Hour bounds are encoded in the pattern itself, so one compiled-DFA match
+# replaces the split/isdigit/int-compare chain per validation.
+_SLOT_PATTERN = re.compile(r"([01]?\d|2[0-3])-([01]?\d|2[0-3])")
+
+
+@lru_cache(maxsize=256)
 def _validate_slot(slot: str) -> None:
-    parts = slot.split("-")
-    if len(parts) != 2:
-        raise AllocationValidationError("time_slot must follow HH-HH format")
-    if not all(part.isdigit() for part in parts):
+    match = _SLOT_PATTERN.fullmatch(slot)
+    if match is None:
         raise AllocationValidationError("time_slot must follow HH-HH format")
-    start_hour, end_hour = (int(part) for part in parts)
-    if not 0 <= start_hour <= 23 or not 0 <= end_hour <= 23 or start_hour >= end_hour:
+    if int(match[1]) >= int(match[2]):
         raise AllocationValidationError("time_slot boundaries are invalid")
 
 
 def _validate_date(date_value: str) -> None:
     try:
-        datetime.strptime(date_value, "%Y-%m-%d")
+        # Cached ordinal parse: repeated dates within a run skip strptime.
+        date_to_days(date_value)
     except ValueError as exc:
         raise AllocationValidationError("date must follow YYYY-MM-DD format") from exc
 
@@ -80,11 +151,9 @@ def _validate_date(date_value: str) -> None:
 def _validate_inputs(
     requested_date: str,
     requested_time_slot: str,
-    config: AllocationConfig,
 ) -> None:
     _validate_date(requested_date)
     _validate_slot(requested_time_slot)
-    validate_allocation_config(config)
 
 
 def compute_fairness_metric(
@@ -94,17 +163,42 @@ def compute_fairness_metric(
     if not allocations:
         return 0.0
 
-    allocated_counts = Counter(decision.stakeholder_id for decision in allocations)
     stakeholders = sorted({request.stakeholder_id for request in requests})
     if not stakeholders:
         return 0.0
 
-    values = [float(allocated_counts.get(stakeholder, 0)) for stakeholder in stakeholders]
-    numerator = sum(values) ** 2
-    denominator = len(values) * sum(value**2 for value in values)
+    # Encode stakeholders once and let bincount + the shared vectorized Jain
+    # kernel replace the Counter/Python-sum path. Decisions for stakeholders
+    # outside the request set are ignored, as before.
+    index_by_stakeholder = {name: index for index, name in enumerate(stakeholders)}
+    codes = np.fromiter(
+        (
+            index_by_stakeholder[decision.stakeholder_id]
+            for decision in allocations
+            if decision.stakeholder_id in index_by_stakeholder
+        ),
+        dtype=np.int64,
+    )
+    counts = np.bincount(codes, minlength=len(stakeholders))
+    return _fairness_from_counts(counts)
+
+
+def _fairness_from_counts(counts: np.ndarray) -> float:
+    """Jain's fairness index over a per-stakeholder allocation-count vector.
+
+    Vectorized twin of :func:`compute_fairness_metric` for callers that
+    already hold counts as an array (the solve path builds them with
+    ``np.bincount`` instead of a Counter over decision objects).
+    """
+    if counts.size == 0:
+        return 0.0
+    total = float(counts.sum())
+    if total == 0.0:
+        return 0.0
+    denominator = counts.size * float(np.square(counts, dtype=np.float64).sum())
     if denominator == 0.0:
         return 0.0
-    return float(numerator / denominator)
+    return total**2 / denominator
 
 
 def _compute_fairness_metric(
@@ -125,22 +219,41 @@ def forecast_demand(
     if not all_slots:
         return []
 
-    max_historical = max(historical_counts_by_slot.get(slot, 0) for slot in all_slots)
-    forecasts: list[DemandForecast] = []
-    for slot in all_slots:
-        historical_count = historical_counts_by_slot.get(slot, 0)
-        if max_historical > 0:
-            demand_intensity = historical_count / max_historical
-        else:
-            demand_intensity = 0.0
-        forecasts.append(
-            DemandForecast(
-                time_slot=slot,
-                historical_count=historical_count,
-                demand_intensity_score=float(demand_intensity),
-            )
+    # Columnar aggregation: counts and intensities are computed as whole
+    # arrays (one max, one vectorized divide) and only lowered to per-slot
+    # DemandForecast views at the boundary.
+    historical_counts = np.fromiter(
+        (historical_counts_by_slot.get(slot, 0) for slot in all_slots),
+        dtype=np.int64,
+        count=len(all_slots),
+    )
+    max_historical = int(historical_counts.max())
+    if max_historical > 0:
+        intensities = historical_counts / max_historical
+    else:
+        intensities = np.zeros(len(all_slots), dtype=np.float64)
+    # tolist() lowers to native int/float in one C pass, so the comprehension
+    # does no per-element numpy-scalar conversions.
+    return [
+        DemandForecast(
+            time_slot=slot,
+            historical_count=count,
+            demand_intensity_score=intensity,
+        )
+        for slot, count, intensity in zip(
+            all_slots, historical_counts.tolist(), intensities.tolist()
         )
-    return forecasts
+    ]
+
+
+def scale_weights(weights: np.ndarray, scale: int) -> np.ndarray:
+    """Scale float objective weights to non-negative int64 CP-SAT coefficients.
+
+    ``np.rint`` rounds half-to-even like Python's ``round``, so the vectorized
+    path produces exactly the coefficients the old per-pair ``int(round(...))``
+    loop did.
+    """
+    return np.clip(np.rint(weights * scale), 0, None).astype(np.int64)
 
 
 def _compute_stakeholder_cap_limit(
@@ -148,12 +261,39 @@ def _compute_stakeholder_cap_limit(
     stakeholder_usage_cap: float,
     total_requests: int,
 ) -> int:
+    """Translate the fractional cap into a constant integer bound.
+
+    Pre-resolving floor(cap * total_requests) here keeps every cap
+    constraint a plain sum(vars) <= small-int: all coefficients stay 1, so
+    CP-SAT's LP relaxation never sees scaled-up ratio encodings.
+    """
     if total_requests <= 0:
         return 0
     limit = int(math.floor(stakeholder_usage_cap * total_requests))
     return max(1, limit)
 
 
+def _room_arrays(
+    rooms: list[Room],
+    predictions: list[IdlePrediction],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Parallel per-room arrays (id, capacity, idle probability) for mask math.
+
+    Eligibility checks are single float/int compares per room; holding rooms
+    as arrays turns the request×room filter loops into vectorized compares
+    instead of attribute access and dict lookups per pair.
+    """
+    prediction_by_room = {prediction.room_id: prediction.idle_probability for prediction in predictions}
+    room_ids = np.fromiter((room.room_id for room in rooms), dtype=np.int64, count=len(rooms))
+    capacities = np.fromiter((room.capacity for room in rooms), dtype=np.int64, count=len(rooms))
+    idle_probabilities = np.fromiter(
+        (prediction_by_room.get(room.room_id, 0.0) for room in rooms),
+        dtype=np.float64,
+        count=len(rooms),
+    )
+    return room_ids, capacities, idle_probabilities
+
+
 def _has_feasible_pair(
     *,
     rooms: list[Room],
@@ -161,16 +301,18 @@ def _has_feasible_pair(
     predictions: list[IdlePrediction],
     config: AllocationConfig,
 ) -> bool:
-    prediction_by_room = {prediction.room_id: prediction.idle_probability for prediction in predictions}
-    for request in requests:
-        for room in rooms:
-            idle_probability = prediction_by_room.get(room.room_id, 0.0)
-            if idle_probability <= config.idle_probability_threshold:
-                continue
-            if room.capacity < request.requested_capacity:
-                continue
-            return True
-    return False
+    if not rooms or not requests:
+        return False
+    _, capacities, idle_probabilities = _room_arrays(rooms, predictions)
+    idle_ok = idle_probabilities > config.idle_probability_threshold
+    requested_capacities = np.fromiter(
+        (request.requested_capacity for request in requests),
+        dtype=np.int64,
+        count=len(requests),
+    )
+    return bool(
+        np.any(idle_ok[None, :] & (capacities[None, :] >= requested_capacities[:, None]))
+    )
 
 
 def greedy_fallback_allocate(
@@ -181,66 +323,83 @@ def greedy_fallback_allocate(
     config: AllocationConfig,
     reason: str,
 ) -> OptimizationResult:
-    prediction_by_room = {prediction.room_id: prediction.idle_probability for prediction in predictions}
-    sorted_requests = sorted(
-        requests,
-        key=lambda request: (
-            -request.priority_weight,
-            request.request_id,
+    # Sort positions rather than request objects so the assigned/unassigned
+    # split below stays a boolean mask over the original request order.
+    order = sorted(
+        range(len(requests)),
+        key=lambda position: (
+            -requests[position].priority_weight,
+            requests[position].request_id,
         ),
     )
-    available_rooms = {room.room_id: room for room in rooms}
-    stakeholder_allocations: Counter[str] = Counter()
+    request_id_array = np.fromiter(
+        (request.request_id for request in requests),
+        dtype=np.int64,
+        count=len(requests),
+    )
+    assigned_mask = np.zeros(len(requests), dtype=bool)
+    room_ids, capacities, idle_probabilities = _room_arrays(rooms, predictions)
+    idle_ok = idle_probabilities > config.idle_probability_threshold
+    available = np.ones(len(rooms), dtype=bool)
+    # Interned codes: cap accounting indexes a small count array instead of
+    # hashing stakeholder strings through a Counter per considered request.
+    registry = StakeholderRegistry.from_names(
+        sorted({request.stakeholder_id for request in requests})
+    )
+    stakeholder_code_by_position = [
+        registry.encode(request.stakeholder_id) for request in requests
+    ]
+    stakeholder_allocation_counts = np.zeros(len(registry), dtype=np.int64)
     stakeholder_limit = _compute_stakeholder_cap_limit(
         stakeholder_usage_cap=config.stakeholder_usage_cap,
         total_requests=len(requests),
     )
 
     allocations: list[AllocationDecision] = []
-    for request in sorted_requests:
-        if stakeholder_allocations[request.stakeholder_id] >= stakeholder_limit:
+    for position in order:
+        request = requests[position]
+        stakeholder_code = stakeholder_code_by_position[position]
+        if stakeholder_allocation_counts[stakeholder_code] >= stakeholder_limit:
             continue
 
-        eligible_rooms = []
-        for room_id, room in available_rooms.items():
-            if room.capacity < request.requested_capacity:
-                continue
-            idle_probability = prediction_by_room.get(room_id, 0.0)
-            if idle_probability <= config.idle_probability_threshold:
-                continue
-            eligible_rooms.append((room, idle_probability))
-
-        if not eligible_rooms:
+        candidates = np.flatnonzero(
+            available & idle_ok & (capacities >= request.requested_capacity)
+        )
+        if candidates.size == 0:
             continue
 
-        selected_room, selected_idle_probability = sorted(
-            eligible_rooms,
-            key=lambda pair: (
-                -pair[1],
-                pair[0].capacity,
-                pair[0].room_id,
-            ),
-        )[0]
-        allocation_score = float(selected_idle_probability * request.priority_weight)
+        # Same tie-break as the old per-pair sort: highest idle probability,
+        # then smallest capacity, then lowest room id. lexsort's last key is
+        # the primary one.
+        selected = candidates[
+            np.lexsort(
+                (
+                    room_ids[candidates],
+                    capacities[candidates],
+                    -idle_probabilities[candidates],
+                )
+            )[0]
+        ]
+        allocation_score = float(idle_probabilities[selected] * request.priority_weight)
         allocations.append(
             AllocationDecision(
                 request_id=request.request_id,
-                room_id=selected_room.room_id,
+                room_id=int(room_ids[selected]),
                 score=allocation_score,
                 stakeholder_id=request.stakeholder_id,
             )
         )
-        stakeholder_allocations[request.stakeholder_id] += 1
-        available_rooms.pop(selected_room.room_id, None)
+        stakeholder_allocation_counts[stakeholder_code] += 1
+        assigned_mask[position] = True
+        available[selected] = False
 
-    allocated_request_ids = {allocation.request_id for allocation in allocations}
-    unassigned_request_ids = [
-        request.request_id
-        for request in requests
-        if request.request_id not in allocated_request_ids
-    ]
+    unassigned_request_ids = request_id_array[~assigned_mask].tolist()
     objective_value = float(sum(allocation.score for allocation in allocations))
-    fairness_metric = compute_fairness_metric(requests=requests, allocations=allocations)
+    # The cap-accounting array already holds per-stakeholder counts, so the
+    # Jain kernel runs on it directly instead of re-grouping decisions.
+    fairness_metric = (
+        _fairness_from_counts(stakeholder_allocation_counts) if allocations else 0.0
+    )
     logger.warning(
         (
             "Greedy fallback allocation used | reason=%s | objective_value=%.6f | "
@@ -260,6 +419,98 @@ def greedy_fallback_allocate(
     )
 
 
+def assignment_shortcut_allocate(
+    *,
+    rooms: list[Room],
+    requests: list[AllocationRequest],
+    predictions: list[IdlePrediction],
+    config: AllocationConfig,
+) -> OptimizationResult:
+    """Solve the uncapped instance as maximum-weight bipartite matching.
+
+    With ``stakeholder_usage_cap >= 1.0`` the per-stakeholder constraints can
+    never bind, so the model collapses to rooms-to-requests matching with
+    nonnegative weights. The Hungarian algorithm solves that exactly and
+    deterministically in polynomial time, skipping CP-SAT model construction
+    and worker startup entirely. Coefficients go through the same
+    ``scale_weights`` rounding as the CP-SAT objective, so both paths agree
+    on objective value and tie handling.
+    """
+    room_ids, capacities, idle_probabilities = _room_arrays(rooms, predictions)
+    eligible_room_indices = np.flatnonzero(
+        idle_probabilities > config.idle_probability_threshold
+    )
+    request_capacities = np.fromiter(
+        (request.requested_capacity for request in requests),
+        dtype=np.int64,
+        count=len(requests),
+    )
+    feasible_grid = (
+        capacities[eligible_room_indices, None] >= request_capacities[None, :]
+    )
+    priority_weights = np.fromiter(
+        (request.priority_weight for request in requests),
+        dtype=np.float64,
+        count=len(requests),
+    )
+    coefficient_grid = scale_weights(
+        idle_probabilities[eligible_room_indices, None] * priority_weights[None, :],
+        config.objective_scale,
+    )
+    # Minimization form: feasible pairs cost minus their (nonnegative) scaled
+    # weight, infeasible pairs a positive pad so the solver only routes
+    # through them when a row has nothing feasible left to take.
+    cost = np.where(feasible_grid, -coefficient_grid, 1)
+
+    assigned = np.zeros(len(requests), dtype=bool)
+    assigned_room_ids = np.zeros(len(requests), dtype=np.int64)
+    scores = np.zeros(len(requests), dtype=np.float64)
+    if cost.size:
+        row_indices, col_indices = linear_sum_assignment(cost)
+        matched = feasible_grid[row_indices, col_indices]
+        row_indices = row_indices[matched]
+        col_indices = col_indices[matched]
+        assigned[col_indices] = True
+        assigned_room_ids[col_indices] = room_ids[eligible_room_indices[row_indices]]
+        scores[col_indices] = (
+            coefficient_grid[row_indices, col_indices] / config.objective_scale
+        )
+
+    allocations = [
+        AllocationDecision(
+            request_id=requests[position].request_id,
+            room_id=int(assigned_room_ids[position]),
+            score=float(scores[position]),
+            stakeholder_id=requests[position].stakeholder_id,
+        )
+        for position in np.flatnonzero(assigned)
+    ]
+    request_id_array = np.fromiter(
+        (request.request_id for request in requests),
+        dtype=np.int64,
+        count=len(requests),
+    )
+    unassigned = request_id_array[~assigned].tolist()
+    objective_value = float(scores.sum())
+    fairness_metric = compute_fairness_metric(requests=requests, allocations=allocations)
+    logger.info(
+        (
+            "Assignment shortcut solve completed | objective_value=%.6f | "
+            "fairness_metric=%.6f | allocations=%s | unassigned=%s"
+        ),
+        objective_value,
+        fairness_metric,
+        len(allocations),
+        len(unassigned),
+    )
+    return OptimizationResult(
+        allocations=allocations,
+        objective_value=objective_value,
+        fairness_metric=fairness_metric,
+        unassigned_request_ids=unassigned,
+    )
+
+
 def build_model(
     *,
     rooms: list[Room],
@@ -269,41 +520,79 @@ def build_model(
 ) -> BuildArtifacts:
     """Build CP-SAT assignment model and return model artifacts."""
     _ensure_solver_dependency()
+    # The model is deliberately per-call: CP-SAT exposes no supported way to
+    # reset a CpModel's proto for reuse, and the preview/approve flow already
+    # skips the second build by replaying the cached preview result. Pooling
+    # would only recycle the wrapper object, not the proto it owns.
     model = cp_model.CpModel()
-    prediction_by_room = {prediction.room_id: prediction.idle_probability for prediction in predictions}
     variables: dict[tuple[int, int], cp_model.IntVar] = {}
-    objective_coefficients: dict[tuple[int, int], int] = {}
+    coefficients: list[int] = []
+    # Populated alongside variable creation so the at-most-one constraints
+    # below never have to re-scan the whole variables dict per request/room.
+    vars_by_request: dict[int, list[cp_model.IntVar]] = defaultdict(list)
+    vars_by_room: dict[int, list[cp_model.IntVar]] = defaultdict(list)
+    # Stakeholders are interned to contiguous codes up front; the grouping
+    # dict then hashes small ints instead of re-hashing id strings per pair.
+    registry = StakeholderRegistry.from_names(
+        sorted({request.stakeholder_id for request in requests})
+    )
+    stakeholder_code_by_position = [
+        registry.encode(request.stakeholder_id) for request in requests
+    ]
+    stakeholder_to_vars: dict[int, list[cp_model.IntVar]] = defaultdict(list)
+
+    # Vectorized pair filtering: threshold-eligible rooms come from one array
+    # compare, and the capacity-feasibility grid is a single broadcast over
+    # eligible rooms × requests, so the Python loop below only visits pairs
+    # that actually become variables.
+    _, capacities, idle_probabilities = _room_arrays(rooms, predictions)
+    eligible_room_indices = np.flatnonzero(
+        idle_probabilities > config.idle_probability_threshold
+    )
+    request_capacities = np.fromiter(
+        (request.requested_capacity for request in requests),
+        dtype=np.int64,
+        count=len(requests),
+    )
+    feasible_grid = (
+        capacities[eligible_room_indices, None] >= request_capacities[None, :]
+    )
+    # Objective coefficients as one outer product: idle probability per
+    # eligible room times priority weight per request, scaled and rounded in
+    # a single vectorized pass instead of one multiply-round per pair.
+    priority_weights = np.fromiter(
+        (request.priority_weight for request in requests),
+        dtype=np.float64,
+        count=len(requests),
+    )
+    coefficient_grid = scale_weights(
+        idle_probabilities[eligible_room_indices, None] * priority_weights[None, :],
+        config.objective_scale,
+    )
+    for grid_row, room_index in enumerate(eligible_room_indices.tolist()):
+        room = rooms[room_index]
+        feasible_request_indices = np.flatnonzero(feasible_grid[grid_row])
+        coefficients.extend(
+            coefficient_grid[grid_row, feasible_request_indices].tolist()
+        )
+        for request_index in feasible_request_indices.tolist():
+            request = requests[request_index]
+            pair = (room.room_id, request.request_id)
+            var = model.NewBoolVar(f"x_room_{room.room_id}_req_{request.request_id}")
+            variables[pair] = var
+            vars_by_request[request.request_id].append(var)
+            vars_by_room[room.room_id].append(var)
+            stakeholder_to_vars[stakeholder_code_by_position[request_index]].append(var)
 
-    for room in rooms:
-        idle_probability = prediction_by_room.get(room.room_id, 0.0)
-        if idle_probability <= config.idle_probability_threshold:
-            continue
+    objective_coefficients = dict(zip(variables, coefficients))
 
-        for request in requests:
-            if room.capacity < request.requested_capacity:
-                continue
-            pair = (room.room_id, request.request_id)
-            variables[pair] = model.NewBoolVar(f"x_room_{room.room_id}_req_{request.request_id}")
-            coefficient = int(round(idle_probability * request.priority_weight * config.objective_scale))
-            objective_coefficients[pair] = max(0, coefficient)
-
-    for request in requests:
-        request_vars = [
-            var
-            for (room_id, request_id), var in variables.items()
-            if request_id == request.request_id
-        ]
-        if request_vars:
-            model.Add(sum(request_vars) <= 1)
-
-    for room in rooms:
-        room_vars = [
-            var
-            for (room_id, _), var in variables.items()
-            if room_id == room.room_id
-        ]
-        if room_vars:
-            model.Add(sum(room_vars) <= 1)
+    # AddAtMostOne feeds CP-SAT's native at-most-one propagator directly
+    # instead of making presolve decode an equivalent linear sum <= 1.
+    for request_vars in vars_by_request.values():
+        model.AddAtMostOne(request_vars)
+
+    for room_vars in vars_by_room.values():
+        model.AddAtMostOne(room_vars)
 
     total_assigned = model.NewIntVar(0, len(requests), "total_assigned")
     if variables:
@@ -311,20 +600,11 @@ def build_model(
     else:
         model.Add(total_assigned == 0)
 
-    stakeholder_to_vars: dict[str, list[cp_model.IntVar]] = defaultdict(list)
-    stakeholder_by_request_id = {
-        request.request_id: request.stakeholder_id for request in requests
-    }
-    for (room_id, request_id), var in variables.items():
-        del room_id
-        stakeholder = stakeholder_by_request_id[request_id]
-        stakeholder_to_vars[stakeholder].append(var)
-
     stakeholder_limit = _compute_stakeholder_cap_limit(
         stakeholder_usage_cap=config.stakeholder_usage_cap,
         total_requests=len(requests),
     )
-    for stakeholder, stakeholder_vars in stakeholder_to_vars.items():
+    for stakeholder_code, stakeholder_vars in stakeholder_to_vars.items():
         if not stakeholder_vars:
             continue
         model.Add(sum(stakeholder_vars) <= stakeholder_limit)
@@ -333,17 +613,16 @@ def build_model(
                 "Stakeholder cap constraint added | stakeholder_id=%s | cap=%.3f | "
                 "stakeholder_limit=%s"
             ),
-            stakeholder,
+            registry.decode(stakeholder_code),
             config.stakeholder_usage_cap,
             stakeholder_limit,
         )
 
     if variables:
+        # WeightedSum builds the linear expression in one binding call instead
+        # of chaining IntVar.__mul__/__add__ per term.
         model.Maximize(
-            sum(
-                objective_coefficients[pair] * var
-                for pair, var in variables.items()
-            )
+            cp_model.LinearExpr.WeightedSum(list(variables.values()), coefficients)
         )
     else:
         model.Maximize(0)
@@ -356,6 +635,24 @@ def build_model(
     )
 
 
+def apply_solution_hints(
+    artifacts: BuildArtifacts,
+    hinted_rooms: dict[int, int],
+) -> int:
+    """Hint the previous run's assignments onto matching model variables.
+
+    Only pairs present in both the cached solution and the new instance are
+    hinted; requests or rooms that disappeared since the last solve are simply
+    skipped, so a stale cache can never make the model infeasible.
+    """
+    hinted = 0
+    for (room_id, request_id), var in artifacts.variables.items():
+        if hinted_rooms.get(request_id) == room_id:
+            artifacts.model.AddHint(var, 1)
+            hinted += 1
+    return hinted
+
+
 def solve_model(
     *,
     artifacts: BuildArtifacts,
@@ -363,8 +660,14 @@ def solve_model(
     requests: list[AllocationRequest],
     predictions: list[IdlePrediction],
     config: AllocationConfig,
+    solver: Optional[Any] = None,
 ) -> OptimizationResult:
-    """Solve CP-SAT model and return allocations, objective, fairness, and misses."""
+    """Solve CP-SAT model and return allocations, objective, fairness, and misses.
+
+    Callers may pass an existing ``CpSolver`` to reuse across solves; its
+    parameter block is overwritten here, so a recycled solver always runs
+    with the current configuration.
+    """
     _ensure_solver_dependency()
 
     if not requests:
@@ -375,10 +678,16 @@ def solve_model(
             unassigned_request_ids=[],
         )
 
-    solver = cp_model.CpSolver()
-    solver.parameters.max_time_in_seconds = float(config.solver_max_time_seconds)
-    solver.parameters.num_search_workers = config.cp_sat_workers
-    solver.parameters.random_seed = config.solver_random_seed
+    if solver is None:
+        solver = cp_model.CpSolver()
+    _apply_solver_parameters(
+        solver,
+        _solver_parameters(
+            config.solver_max_time_seconds,
+            _resolve_worker_count(config.cp_sat_workers),
+            config.solver_random_seed,
+        ),
+    )
 
     status = solver.Solve(artifacts.model)
     status_name = solver.StatusName(status)
@@ -391,30 +700,67 @@ def solve_model(
             reason=f"cp_sat_status={status_name}",
         )
 
-    request_lookup = {request.request_id: request for request in requests}
-    allocations: list[AllocationDecision] = []
-    for (room_id, request_id), var in artifacts.variables.items():
-        if solver.Value(var) != 1:
-            continue
-        request = request_lookup[request_id]
-        score = artifacts.objective_coefficients[(room_id, request_id)] / config.objective_scale
-        allocations.append(
-            AllocationDecision(
-                request_id=request_id,
-                room_id=room_id,
-                score=score,
-                stakeholder_id=request.stakeholder_id,
-            )
+    # Structure-of-arrays extraction: each request is assigned at most once,
+    # so parallel arrays indexed by request position hold the full solution.
+    # Aggregations (fairness counts, unassigned split) then run as array ops
+    # instead of per-decision object traversal.
+    position_by_request_id = {
+        request.request_id: position for position, request in enumerate(requests)
+    }
+    registry = StakeholderRegistry.from_names(
+        sorted({request.stakeholder_id for request in requests})
+    )
+    stakeholder_codes = np.fromiter(
+        (registry.encode(request.stakeholder_id) for request in requests),
+        dtype=np.int32,
+        count=len(requests),
+    )
+    assigned = np.zeros(len(requests), dtype=bool)
+    room_ids = np.zeros(len(requests), dtype=np.int32)
+    scores = np.zeros(len(requests), dtype=np.float64)
+    # BooleanValue reads the bool literal directly instead of round-tripping
+    # through the integer domain accessor. Draining every variable in one
+    # list comprehension keeps the pybind boundary crossings in a single
+    # tight loop, and flatnonzero then visits only the set literals.
+    pairs = list(artifacts.variables.keys())
+    literal_values = np.fromiter(
+        (solver.BooleanValue(var) for var in artifacts.variables.values()),
+        dtype=bool,
+        count=len(pairs),
+    )
+    for pair_index in np.flatnonzero(literal_values).tolist():
+        room_id, request_id = pairs[pair_index]
+        position = position_by_request_id[request_id]
+        assigned[position] = True
+        room_ids[position] = room_id
+        scores[position] = (
+            artifacts.objective_coefficients[(room_id, request_id)] / config.objective_scale
         )
 
-    allocated_ids = {allocation.request_id for allocation in allocations}
-    unassigned = [
-        request.request_id
-        for request in requests
-        if request.request_id not in allocated_ids
+    allocations = [
+        AllocationDecision(
+            request_id=requests[position].request_id,
+            room_id=int(room_ids[position]),
+            score=float(scores[position]),
+            stakeholder_id=requests[position].stakeholder_id,
+        )
+        for position in np.flatnonzero(assigned)
     ]
+    request_id_array = np.fromiter(
+        (request.request_id for request in requests),
+        dtype=np.int64,
+        count=len(requests),
+    )
+    unassigned = request_id_array[~assigned].tolist()
     objective_value = float(solver.ObjectiveValue()) / config.objective_scale
-    fairness_metric = compute_fairness_metric(requests=requests, allocations=allocations)
+    if allocations:
+        allocation_counts = np.bincount(
+            stakeholder_codes[assigned],
+            minlength=len(registry),
+        )
+        fairness_metric = _fairness_from_counts(allocation_counts)
+    else:
+        fairness_metric = 0.0
 
     logger.info(
         (
@@ -457,6 +803,8 @@ def optimize_with_fallback(
     requests: list[AllocationRequest],
     predictions: list[IdlePrediction],
     config: AllocationConfig,
+    solution_hint: Optional[dict[int, int]] = None,
+    solver: Optional[Any] = None,
 ) -> OptimizationResult:
     if not requests:
         return OptimizationResult(
@@ -465,6 +813,17 @@ def optimize_with_fallback(
             fairness_metric=0.0,
             unassigned_request_ids=[],
         )
+    if config.stakeholder_usage_cap >= 1.0 and linear_sum_assignment is not None:
+        # No binding fairness cap: the problem is plain bipartite matching,
+        # which the Hungarian shortcut solves exactly without CP-SAT. When
+        # SciPy is absent the branch falls through to the CP-SAT path below,
+        # which handles the uncapped instance correctly, just slower.
+        return assignment_shortcut_allocate(
+            rooms=rooms,
+            requests=requests,
+            predictions=predictions,
+            config=config,
+        )
     if cp_model is None:
         return greedy_fallback_allocate(
             rooms=rooms,
@@ -480,12 +839,16 @@ def optimize_with_fallback(
             predictions=predictions,
             config=config,
         )
+        if solution_hint:
+            hinted = apply_solution_hints(artifacts, solution_hint)
+            logger.debug("Warm-start hints applied | hinted_pairs=%s", hinted)
         return solve_model(
             artifacts=artifacts,
             rooms=rooms,
             requests=requests,
             predictions=predictions,
             config=config,
+            solver=solver,
         )
     except Exception as exc:  # pragma: no cover - defensive runtime fallback
         logger.exception("CP-SAT allocation failed unexpectedly, switching to greedy fallback")
@@ -510,14 +873,13 @@ def persist_results(
         forecast_date=requested_date,
         forecasts=forecasts,
     )
-    repository.save_allocation_logs(
+    # Log rows and status flips are one atomic unit (and one fsync).
+    repository.finalize_allocations(
         allocations=[
             (allocation.request_id, allocation.room_id, allocation.score)
             for allocation in result.allocations
-        ]
-    )
-    repository.mark_requests_allocated(
-        [allocation.request_id for allocation in result.allocations]
+        ],
+        request_ids=[allocation.request_id for allocation in result.allocations],
     )
 
 
@@ -533,6 +895,71 @@ class AllocationOptimizationService:
         self._settings = settings or get_settings()
         self._repository = repository or DataRepository(self._settings)
         self._prediction_service = prediction_service
+        # Settings-derived invariants are checked once (and the instance
+        # cached process-wide); only caller overrides are re-checked.
+        self._base_config = allocation_config_from(self._settings)
+        # Last committed assignment per packed (date, slot) key, used as
+        # CP-SAT solution hints on re-solves when warm starts are enabled.
+        self._last_solutions: dict[int, dict[int, int]] = {}
+        # One CpSolver recycled across solves; constructing the solver and
+        # its parameters proto per call is pure binding-layer overhead.
+        # A non-blocking lock hands it to one solve at a time — concurrent
+        # solves simply fall back to a throwaway instance.
+        self._shared_solver: Optional[Any] = (
+            cp_model.CpSolver() if cp_model is not None else None
+        )
+        self._solver_lock = threading.Lock()
+        # Optional single-writer queue: when async persistence is enabled,
+        # approve/optimize callers enqueue their outputs and return without
+        # waiting on the commit. One daemon writer keeps ordering intact.
+        self._persist_queue: Optional[queue.Queue] = None
+        if self._settings.allocation_async_persist:
+            self._persist_queue = queue.Queue()
+            threading.Thread(
+                target=self._drain_persist_queue,
+                name="allocation-persist-writer",
+                daemon=True,
+            ).start()
+
+    def _drain_persist_queue(self) -> None:
+        assert self._persist_queue is not None
+        while True:
+            requested_date, forecasts, result = self._persist_queue.get()
+            try:
+                persist_results(
+                    repository=self._repository,
+                    requested_date=requested_date,
+                    forecasts=forecasts,
+                    result=result,
+                )
+            except Exception:  # pragma: no cover - background writer guard
+                logger.exception(
+                    "Background persist failed | requested_date=%s", requested_date
+                )
+            finally:
+                self._persist_queue.task_done()
+
+    def _persist(
+        self,
+        *,
+        requested_date: str,
+        forecasts: list[DemandForecast],
+        result: OptimizationResult,
+    ) -> None:
+        if self._persist_queue is not None:
+            self._persist_queue.put((requested_date, forecasts, result))
+            return
+        persist_results(
+            repository=self._repository,
+            requested_date=requested_date,
+            forecasts=forecasts,
+            result=result,
+        )
+
+    def flush_pending_persists(self) -> None:
+        """Block until queued background writes are committed (no-op when sync)."""
+        if self._persist_queue is not None:
+            self._persist_queue.join()
 
     def _ensure_predictions_for_slot(
         self,
@@ -593,35 +1020,38 @@ class AllocationOptimizationService:
             requested_time_slot=requested_time_slot,
         )
 
-    def optimize_allocation(
+    def _solve_allocation(
         self,
         *,
         requested_date: str,
         requested_time_slot: str,
         idle_probability_threshold: Optional[float] = None,
         stakeholder_usage_cap: Optional[float] = None,
-        persist_outputs: bool = True,
-    ) -> OptimizationResult:
-        config = AllocationConfig(
-            idle_probability_threshold=(
-                idle_probability_threshold
-                if idle_probability_threshold is not None
-                else self._settings.allocation_idle_probability_threshold
-            ),
-            stakeholder_usage_cap=(
-                stakeholder_usage_cap
-                if stakeholder_usage_cap is not None
-                else self._settings.allocation_stakeholder_usage_cap
-            ),
-            solver_max_time_seconds=self._settings.allocation_solver_max_time_seconds,
-            solver_random_seed=self._settings.allocation_solver_random_seed,
-            objective_scale=self._settings.allocation_objective_scale,
-            cp_sat_workers=self._settings.allocation_cp_sat_workers,
-        )
+    ) -> tuple[OptimizationResult, list[DemandForecast], list[AllocationRequest]]:
+        """Run forecasting and the solve itself without touching storage.
+
+        The pending requests used during solving are returned alongside the
+        result so callers enriching the output never re-list them.
+        """
+        config = self._base_config
+        if idle_probability_threshold is not None or stakeholder_usage_cap is not None:
+            config = replace(
+                config,
+                idle_probability_threshold=(
+                    idle_probability_threshold
+                    if idle_probability_threshold is not None
+                    else config.idle_probability_threshold
+                ),
+                stakeholder_usage_cap=(
+                    stakeholder_usage_cap
+                    if stakeholder_usage_cap is not None
+                    else config.stakeholder_usage_cap
+                ),
+            )
+            validate_allocation_config(config)
         _validate_inputs(
             requested_date=requested_date,
             requested_time_slot=requested_time_slot,
-            config=config,
         )
 
         rooms = self._repository.list_rooms_for_allocation()
@@ -646,19 +1076,12 @@ class AllocationOptimizationService:
                 fairness_metric=0.0,
                 unassigned_request_ids=[request.request_id for request in requests],
             )
-            if persist_outputs:
-                persist_results(
-                    repository=self._repository,
-                    requested_date=requested_date,
-                    forecasts=forecasts,
-                    result=result,
-                )
             logger.info(
                 "Allocation skipped due to empty inputs | rooms=%s | requests=%s",
                 len(rooms),
                 len(requests),
             )
-            return result
+            return result, forecasts, requests
 
         predictions = self._ensure_predictions_for_slot(
             requested_date=requested_date,
@@ -666,19 +1089,36 @@ class AllocationOptimizationService:
             rooms=rooms,
         )
 
-        result = optimize_with_fallback(
-            rooms=rooms,
-            requests=requests,
-            predictions=predictions,
-            config=config,
-        )
-        if persist_outputs:
-            persist_results(
-                repository=self._repository,
-                requested_date=requested_date,
-                forecasts=forecasts,
-                result=result,
+        solution_hint: Optional[dict[int, int]] = None
+        if self._settings.allocation_use_warm_start:
+            solution_hint = self._last_solutions.get(
+                pack_time_key(requested_date, requested_time_slot)
             )
+        if self._shared_solver is not None and self._solver_lock.acquire(blocking=False):
+            try:
+                result = optimize_with_fallback(
+                    rooms=rooms,
+                    requests=requests,
+                    predictions=predictions,
+                    config=config,
+                    solution_hint=solution_hint,
+                    solver=self._shared_solver,
+                )
+            finally:
+                self._solver_lock.release()
+        else:
+            result = optimize_with_fallback(
+                rooms=rooms,
+                requests=requests,
+                predictions=predictions,
+                config=config,
+                solution_hint=solution_hint,
+            )
+        if self._settings.allocation_use_warm_start and result.allocations:
+            self._last_solutions[pack_time_key(requested_date, requested_time_slot)] = {
+                allocation.request_id: allocation.room_id
+                for allocation in result.allocations
+            }
         logger.info(
             (
                 "Optimization completed | objective_value=%.6f | fairness_metric=%.6f | "
@@ -688,4 +1128,61 @@ class AllocationOptimizationService:
             result.fairness_metric,
             result.unassigned_request_ids,
         )
+        return result, forecasts, requests
+
+    def optimize_allocation(
+        self,
+        *,
+        requested_date: str,
+        requested_time_slot: str,
+        idle_probability_threshold: Optional[float] = None,
+        stakeholder_usage_cap: Optional[float] = None,
+        persist_outputs: bool = True,
+    ) -> OptimizationResult:
+        result, forecasts, _ = self._solve_allocation(
+            requested_date=requested_date,
+            requested_time_slot=requested_time_slot,
+            idle_probability_threshold=idle_probability_threshold,
+            stakeholder_usage_cap=stakeholder_usage_cap,
+        )
+        if persist_outputs:
+            self._persist(
+                requested_date=requested_date,
+                forecasts=forecasts,
+                result=result,
+            )
         return result
+
+    def preview_allocation_outputs(
+        self,
+        *,
+        requested_date: str,
+        requested_time_slot: str,
+        idle_probability_threshold: Optional[float] = None,
+        stakeholder_usage_cap: Optional[float] = None,
+    ) -> tuple[OptimizationResult, list[DemandForecast], list[AllocationRequest]]:
+        """Solve without persisting so a later approve can reuse the outputs.
+
+        Also hands back the pending requests already fetched for the solve,
+        saving preview callers a second repository round-trip.
+        """
+        return self._solve_allocation(
+            requested_date=requested_date,
+            requested_time_slot=requested_time_slot,
+            idle_probability_threshold=idle_probability_threshold,
+            stakeholder_usage_cap=stakeholder_usage_cap,
+        )
+
+    def persist_allocation_outputs(
+        self,
+        *,
+        requested_date: str,
+        forecasts: list[DemandForecast],
+        result: OptimizationResult,
+    ) -> None:
+        """Persist previously solved outputs (the approve half of the workflow)."""
+        self._persist(
+            requested_date=requested_date,
+            forecasts=forecasts,
+            result=result,
+        )
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import hashlib
+import math
 import re
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from pathlib import Path
 from threading import RLock
 from typing import Any, Dict, Optional
 
+import joblib
 import numpy as np
 import pandas as pd
 from sklearn.compose import ColumnTransformer
@@ -16,7 +20,7 @@ from sklearn.linear_model import LogisticRegression
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import OneHotEncoder
 
-from backend.repository.data_repository import BookingRecord, DataRepository
+from backend.repository.data_repository import BookingColumns, DataRepository
 from backend.utils.config import Settings, get_settings
 from backend.utils.logger import get_logger
 
@@ -70,6 +74,23 @@ class ModelMetadata:
         }
 
 
+@dataclass(frozen=True)
+class _FastPredictPath:
+    """Flattened logistic-regression inference state for single predictions.
+
+    Holds the fitted one-hot category positions and classifier weights so a
+    single predict is a buffer fill plus one dot product, skipping the
+    one-row DataFrame and ColumnTransformer dispatch entirely.
+    """
+
+    slot_position: dict[str, int]
+    room_type_position: dict[str, int]
+    numeric_offset: int
+    coefficients: np.ndarray
+    intercept: float
+    buffer: np.ndarray
+
+
 class AvailabilityPredictionService:
     """Trains and serves the baseline logistic regression model."""
 
@@ -88,7 +109,14 @@ class AvailabilityPredictionService:
     ) -> None:
         self._settings = settings or get_settings()
         self._repository = repository or DataRepository(self._settings)
+        # Compiled once: re.compile per validation re-parses the pattern (or
+        # at best probes the re module's cache) on every predict call.
+        self._time_slot_pattern = re.compile(self._settings.prediction_time_slot_regex)
         self._model: Optional[Pipeline] = None
+        self._fast_path: Optional[_FastPredictPath] = None
+        # Column of class 1 in predict_proba output, fixed after fit;
+        # -1 when the estimator never saw an occupied row.
+        self._occupied_column = -1
         self._model_lock = RLock()
         self._trained_at: Optional[datetime] = None
         self._training_rows: int = 0
@@ -98,13 +126,17 @@ class AvailabilityPredictionService:
         if room_id <= 0:
             raise PredictionValidationError("room_id must be a positive integer")
 
+        # Fixed-layout parse: int slicing is an order of magnitude cheaper
+        # than strptime's format-string interpreter for YYYY-MM-DD input,
+        # and datetime() itself still rejects out-of-range fields.
         try:
-            parsed_date = datetime.strptime(date, "%Y-%m-%d")
+            if len(date) != 10 or date[4] != "-" or date[7] != "-":
+                raise ValueError(date)
+            parsed_date = datetime(int(date[0:4]), int(date[5:7]), int(date[8:10]))
         except ValueError as exc:
             raise PredictionValidationError("date must follow YYYY-MM-DD format") from exc
 
-        pattern = re.compile(self._settings.prediction_time_slot_regex)
-        if pattern.fullmatch(time_slot) is None:
+        if self._time_slot_pattern.fullmatch(time_slot) is None:
             raise PredictionValidationError(
                 "time_slot must follow HH-HH format with 24-hour boundaries"
             )
@@ -115,60 +147,102 @@ class AvailabilityPredictionService:
 
         return parsed_date
 
-    def _build_training_frame(self, records: list[BookingRecord]) -> pd.DataFrame:
+    def _build_training_frame(self, columns: BookingColumns) -> pd.DataFrame:
         """Create model-ready frame with historical and rolling context."""
 
+        # Columnar repository arrays become DataFrame columns directly; no
+        # per-row dict materialization, and copy=False adopts the arrays
+        # as-is since the repository hands over a fresh result per call.
         frame = pd.DataFrame(
-            [
-                {
-                    "room_id": record.room_id,
-                    "date": record.date,
-                    "time_slot": record.time_slot,
-                    "occupied": record.occupied,
-                    "room_type": record.room_type,
-                }
-                for record in records
-            ]
+            {
+                "room_id": columns.room_id,
+                "date": columns.date,
+                "time_slot": columns.time_slot,
+                "occupied": columns.occupied,
+                "room_type": columns.room_type,
+            },
+            copy=False,
         )
         if frame.empty:
             return frame
 
-        frame["date_dt"] = pd.to_datetime(frame["date"], format="%Y-%m-%d", errors="coerce")
-        frame = frame.dropna(subset=["date_dt"]).copy()
+        # ISO dates sort lexicographically, so ordering works on the raw
+        # strings and day-of-week falls out of epoch-day arithmetic on a
+        # strict datetime64 cast — no object-to-datetime column parse. The
+        # coercing pandas parser only runs if the cast rejects a row.
+        frame = frame.sort_values(by=["room_id", "time_slot", "date"])
+        try:
+            date_values = frame["date"].to_numpy().astype("datetime64[D]")
+        except ValueError:
+            parsed = pd.to_datetime(frame["date"], format="%Y-%m-%d", errors="coerce")
+            valid = parsed.notna().to_numpy()
+            frame = frame.loc[valid].copy()
+            date_values = parsed.to_numpy(dtype="datetime64[D]")[valid]
         if frame.empty:
             return frame
 
-        frame = frame.sort_values(by=["room_id", "time_slot", "date_dt"])
-        frame["day_of_week"] = frame["date_dt"].dt.dayofweek.astype(int)
-
-        group_series = frame.groupby(["room_id", "time_slot"], sort=False)["occupied"]
-        prev_count = group_series.cumcount()
-        prev_sum = group_series.cumsum() - frame["occupied"]
+        # datetime64[D] counts days from 1970-01-01, a Thursday (weekday 3).
+        frame["day_of_week"] = (date_values.astype(np.int64) + 3) % 7
+
+        # Both lagged aggregates fall out of one cumulative-sum pass over the
+        # sorted arrays. The previous groupby cumcount/cumsum plus
+        # transform(lambda shift().rolling().mean()) invoked Python per
+        # (room, slot) group and allocated two intermediate Series each time;
+        # here group boundaries are a vectorized compare and the windowed sum
+        # is a cumsum difference.
+        total_rows = len(frame)
+        room_values = frame["room_id"].to_numpy()
+        slot_values = frame["time_slot"].to_numpy()
+        occupied_values = frame["occupied"].to_numpy(dtype=np.float64)
+        row_index = np.arange(total_rows)
+        new_group = np.empty(total_rows, dtype=bool)
+        new_group[0] = True
+        new_group[1:] = (room_values[1:] != room_values[:-1]) | (
+            slot_values[1:] != slot_values[:-1]
+        )
+        group_start = np.maximum.accumulate(np.where(new_group, row_index, 0))
+        prev_count = row_index - group_start
+        cumulative_before = np.cumsum(occupied_values) - occupied_values
+        prev_sum = cumulative_before - cumulative_before[group_start]
 
-        global_occupancy_mean = float(frame["occupied"].mean())
+        global_occupancy_mean = float(occupied_values.mean())
         frame["historical_occupancy_frequency"] = np.where(
             prev_count > 0,
-            prev_sum / prev_count,
+            prev_sum / np.maximum(prev_count, 1),
             global_occupancy_mean,
         )
 
+        # Lagged rolling mean: the trailing-window sum is the expanding prev
+        # sum minus its value `window` rows earlier in the same group; rows
+        # with no predecessors fall back to the historical frequency, exactly
+        # as the old fillna did.
         rolling_window_days = self._settings.prediction_rolling_window_days
-        frame["rolling_7d_occupancy_average"] = (
-            group_series.transform(
-                lambda series: series.shift(1).rolling(
-                    window=rolling_window_days,
-                    min_periods=1,
-                ).mean()
-            )
+        window_sum = prev_sum.copy()
+        beyond_window = prev_count >= rolling_window_days
+        window_sum[beyond_window] -= prev_sum[
+            row_index[beyond_window] - rolling_window_days
+        ]
+        window_count = np.minimum(prev_count, rolling_window_days)
+        frame["rolling_7d_occupancy_average"] = np.where(
+            window_count > 0,
+            window_sum / np.maximum(window_count, 1),
+            frame["historical_occupancy_frequency"],
         )
-        frame["rolling_7d_occupancy_average"] = frame[
-            "rolling_7d_occupancy_average"
-        ].fillna(frame["historical_occupancy_frequency"])
 
         return frame
 
     def prepare_features(self, room_id: int, date: str, time_slot: str) -> pd.DataFrame:
         """Assemble inference-time features for a single room/date/slot request."""
+        feature_row = self._feature_values(room_id=room_id, date=date, time_slot=time_slot)
+        return pd.DataFrame([feature_row], columns=self._FEATURE_COLUMNS)
+
+    def _feature_values(
+        self,
+        room_id: int,
+        date: str,
+        time_slot: str,
+    ) -> dict[str, Any]:
+        """Gather the raw feature values for one room/date/slot request."""
 
         parsed_date = self._validate_inputs(room_id=room_id, date=date, time_slot=time_slot)
         room = self._repository.get_room(room_id)
@@ -192,28 +266,94 @@ class AvailabilityPredictionService:
         if rolling_average is None:
             rolling_average = historical_frequency
 
-        feature_row = {
+        return {
             "day_of_week": parsed_date.weekday(),
             "time_slot": time_slot,
             "room_type": room.room_type,
             "historical_occupancy_frequency": float(historical_frequency),
             "rolling_7d_occupancy_average": float(rolling_average),
         }
-        return pd.DataFrame([feature_row], columns=self._FEATURE_COLUMNS)
+
+    def _prepare_fast_path(self) -> None:
+        """Flatten the fitted pipeline for direct single-row inference.
+
+        Only the logistic-regression pipeline with both classes observed is
+        flattened; anything else (dummy fallback, unexpected shape) leaves
+        the fast path unset and predictions go through the Pipeline.
+        """
+        self._fast_path = None
+        model = self._model
+        if model is None:
+            self._occupied_column = -1
+            return
+        classes = list(model.classes_)  # type: ignore[attr-defined]
+        self._occupied_column = classes.index(1) if 1 in classes else -1
+        try:
+            preprocessor = model.named_steps["preprocessor"]
+            classifier = model.named_steps["classifier"]
+            if not isinstance(classifier, LogisticRegression):
+                return
+            if list(classifier.classes_) != [0, 1]:
+                return
+            encoder = preprocessor.named_transformers_["categorical"]
+            slot_categories, room_type_categories = encoder.categories_
+            # ColumnTransformer output order: one-hot slots, one-hot room
+            # types, then the three passthrough numeric columns.
+            numeric_offset = len(slot_categories) + len(room_type_categories)
+            coefficients = np.asarray(classifier.coef_[0], dtype=np.float64)
+            if coefficients.shape[0] != numeric_offset + 3:
+                return
+            self._fast_path = _FastPredictPath(
+                slot_position={
+                    slot: position for position, slot in enumerate(slot_categories.tolist())
+                },
+                room_type_position={
+                    room_type: numeric_offset - len(room_type_categories) + position
+                    for position, room_type in enumerate(room_type_categories.tolist())
+                },
+                numeric_offset=numeric_offset,
+                coefficients=coefficients,
+                intercept=float(classifier.intercept_[0]),
+                buffer=np.zeros(coefficients.shape[0], dtype=np.float64),
+            )
+        except Exception:  # pragma: no cover - defensive against sklearn drift
+            logger.warning("Fast predict path unavailable; using Pipeline", exc_info=True)
+            self._fast_path = None
+
+    def _fast_occupancy_probability(self, feature_row: dict[str, Any]) -> Optional[float]:
+        """Direct sigmoid over cached weights, or None when inapplicable."""
+        fast = self._fast_path
+        if fast is None:
+            return None
+        buffer = fast.buffer
+        buffer.fill(0.0)
+        # Missing categories simply leave their lanes at zero, which is
+        # exactly what the fitted encoder's handle_unknown="ignore" emits.
+        slot_position = fast.slot_position.get(feature_row["time_slot"])
+        if slot_position is not None:
+            buffer[slot_position] = 1.0
+        room_type_position = fast.room_type_position.get(feature_row["room_type"])
+        if room_type_position is not None:
+            buffer[room_type_position] = 1.0
+        buffer[fast.numeric_offset] = float(feature_row["day_of_week"])
+        buffer[fast.numeric_offset + 1] = feature_row["historical_occupancy_frequency"]
+        buffer[fast.numeric_offset + 2] = feature_row["rolling_7d_occupancy_average"]
+        decision = float(fast.coefficients @ buffer) + fast.intercept
+        return 1.0 / (1.0 + math.exp(-decision))
 
     def train_model(self) -> None:
         """Train baseline model once and cache it in memory."""
 
         with self._model_lock:
             logger.info("Prediction training started")
-            records = self._repository.get_booking_history_for_training()
-            self._training_rows = len(records)
+            columns = self._repository.get_booking_history_for_training()
+            self._training_rows = len(columns)
             if self._training_rows < self._settings.prediction_min_training_rows:
                 raise ModelNotReadyError(
                     "Insufficient booking history for model training"
                 )
 
-            training_frame = self._build_training_frame(records)
+            training_frame = self._build_training_frame(columns)
             if training_frame.empty:
                 raise ModelNotReadyError(
                     "Training data is empty after feature engineering"
@@ -264,6 +404,7 @@ class AvailabilityPredictionService:
             pipeline.fit(x_train, y_train)
 
             self._model = pipeline
+            self._prepare_fast_path()
             self._trained_at = datetime.now(timezone.utc)
             trained_at = self._trained_at.isoformat()
             self._model_metadata = ModelMetadata(
@@ -286,24 +427,96 @@ class AvailabilityPredictionService:
                 trained_at,
             )
 
+    @staticmethod
+    def _training_data_hash(columns: BookingColumns) -> str:
+        """Fingerprint the training rows so a cached model can prove freshness."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(np.ascontiguousarray(columns.room_id).tobytes())
+        digest.update(np.ascontiguousarray(columns.occupied).tobytes())
+        digest.update("\n".join(columns.date).encode())
+        digest.update("\n".join(columns.time_slot).encode())
+        return digest.hexdigest()
+
+    def load_or_train(self, cache_path: Optional[Path] = None) -> None:
+        """Restore the trained pipeline from disk, or train and cache it.
+
+        The seed data is deterministic, so a pickled pipeline keyed by a hash
+        of the training rows (plus the configured model version) is valid
+        across restarts: startup pays a ~10ms joblib load instead of a full
+        fit. Any mismatch or unreadable cache falls back to training and
+        rewrites the cache.
+        """
+        path = cache_path or self._settings.prediction_model_cache_path
+        with self._model_lock:
+            columns = self._repository.get_booking_history_for_training()
+            data_hash = self._training_data_hash(columns)
+            if path.exists():
+                try:
+                    payload = joblib.load(path)
+                except Exception:
+                    logger.warning("Model cache at %s is unreadable; retraining", path)
+                else:
+                    if (
+                        payload.get("data_hash") == data_hash
+                        and payload.get("model_version") == self._settings.prediction_model_version
+                    ):
+                        metadata: ModelMetadata = payload["metadata"]
+                        self._model = payload["model"]
+                        self._prepare_fast_path()
+                        self._model_metadata = metadata
+                        self._training_rows = metadata.training_rows
+                        self._trained_at = datetime.fromisoformat(metadata.trained_at)
+                        self._repository.save_model_metadata(
+                            model_type=metadata.model_type,
+                            model_version=metadata.model_version,
+                            trained_at=metadata.trained_at,
+                            training_rows=metadata.training_rows,
+                        )
+                        logger.info(
+                            "Prediction model restored from cache | path=%s | rows=%s",
+                            path,
+                            metadata.training_rows,
+                        )
+                        return
+                    logger.info(
+                        "Model cache at %s is stale (data or version changed); retraining",
+                        path,
+                    )
+
+            self.train_model()
+            try:
+                joblib.dump(
+                    {
+                        "model": self._model,
+                        "metadata": self._model_metadata,
+                        "data_hash": data_hash,
+                        "model_version": self._settings.prediction_model_version,
+                    },
+                    path,
+                    compress=3,
+                )
+            except OSError:
+                logger.warning("Could not write model cache at %s; continuing", path)
+
     def retrain_model(self) -> None:
         """Explicit retraining hook for operators and future admin endpoint use."""
         logger.info("Manual model retraining requested")
         self.train_model()
 
-    def _get_occupancy_probability(self, feature_frame: pd.DataFrame) -> float:
+    def _get_occupancy_probabilities(self, feature_frame: pd.DataFrame) -> np.ndarray:
         if self._model is None:
             raise ModelNotReadyError("Model is not trained; call train_model() first")
 
-        classes = list(self._model.classes_)  # type: ignore[attr-defined]
-        probabilities = self._model.predict_proba(feature_frame)[0]
-
-        if 1 in classes:
-            occupied_idx = classes.index(1)
-            return float(probabilities[occupied_idx])
+        # classes_ is fixed after fit, so the class-1 column is resolved once
+        # when the model is installed; -1 means the estimator only knows
+        # class 0 and every row falls back to zero occupancy.
+        if self._occupied_column < 0:
+            return np.zeros(len(feature_frame), dtype=np.float64)
+        probabilities = self._model.predict_proba(feature_frame)
+        return probabilities[:, self._occupied_column].astype(np.float64)
 
-        # Defensive fallback if estimator only knows class 0.
-        return 0.0
+    def _get_occupancy_probability(self, feature_frame: pd.DataFrame) -> float:
+        return float(self._get_occupancy_probabilities(feature_frame)[0])
 
     def get_model_metadata(self) -> dict[str, Any]:
         with self._model_lock:
@@ -324,12 +537,17 @@ class AvailabilityPredictionService:
     ) -> Dict[str, float]:
         """Run availability inference with optional persistence."""
         with self._model_lock:
-            feature_frame = self.prepare_features(
+            feature_row = self._feature_values(
                 room_id=room_id,
                 date=date,
                 time_slot=time_slot,
             )
-            occupancy_probability = self._get_occupancy_probability(feature_frame)
+            # Flattened weights first; the one-row DataFrame + Pipeline walk
+            # only runs when the fast path cannot serve this input.
+            occupancy_probability = self._fast_occupancy_probability(feature_row)
+            if occupancy_probability is None:
+                feature_frame = pd.DataFrame([feature_row], columns=self._FEATURE_COLUMNS)
+                occupancy_probability = self._get_occupancy_probability(feature_frame)
             idle_probability = max(0.0, min(1.0, 1.0 - occupancy_probability))
             confidence_score = abs(idle_probability - 0.5) * 2.0
 
@@ -357,3 +575,97 @@ class AvailabilityPredictionService:
                 confidence_score,
             )
             return result.to_dict()
+
+    def predict_batch(
+        self,
+        *,
+        room_ids: list[int],
+        date: str,
+        time_slot: str,
+        persist: bool = True,
+    ) -> Dict[int, Dict[str, float]]:
+        """Run availability inference for many rooms in one model call.
+
+        The per-slot aggregates come from one grouped query each instead of a
+        pair of queries per room, and the whole feature frame goes through
+        predict_proba at once, so repository round-trips and sklearn dispatch
+        are paid per batch rather than per room. Persistence, when requested,
+        is likewise one transaction for all rows.
+        """
+        if not room_ids:
+            return {}
+        with self._model_lock:
+            # Date and slot are shared across the batch; full validation runs
+            # once, the remaining rooms only need the id check.
+            parsed_date = self._validate_inputs(
+                room_id=room_ids[0], date=date, time_slot=time_slot
+            )
+            for room_id in room_ids[1:]:
+                if room_id <= 0:
+                    raise PredictionValidationError("room_id must be a positive integer")
+
+            room_types: list[str] = []
+            for room_id in room_ids:
+                room = self._repository.get_room(room_id)
+                if room is None:
+                    raise RoomNotFoundError(f"room_id {room_id} not found")
+                room_types.append(room.room_type)
+
+            global_frequency = self._repository.get_global_occupancy_frequency()
+            historical_by_room = self._repository.get_historical_occupancy_frequencies(
+                time_slot=time_slot,
+            )
+            rolling_by_room = self._repository.get_rolling_occupancy_averages(
+                time_slot=time_slot,
+                target_date=date,
+                window_days=self._settings.prediction_rolling_window_days,
+            )
+            historical = [
+                float(historical_by_room.get(room_id, global_frequency))
+                for room_id in room_ids
+            ]
+            rolling = [
+                float(rolling_by_room.get(room_id, frequency))
+                for room_id, frequency in zip(room_ids, historical)
+            ]
+
+            feature_frame = pd.DataFrame(
+                {
+                    "day_of_week": [parsed_date.weekday()] * len(room_ids),
+                    "time_slot": [time_slot] * len(room_ids),
+                    "room_type": room_types,
+                    "historical_occupancy_frequency": historical,
+                    "rolling_7d_occupancy_average": rolling,
+                },
+                columns=self._FEATURE_COLUMNS,
+            )
+            occupancy_probabilities = self._get_occupancy_probabilities(feature_frame)
+            idle_probabilities = np.clip(1.0 - occupancy_probabilities, 0.0, 1.0)
+            confidence_scores = np.abs(idle_probabilities - 0.5) * 2.0
+
+            if persist:
+                self._repository.save_predictions(
+                    (int(room_id), date, time_slot, float(idle_probability))
+                    for room_id, idle_probability in zip(
+                        room_ids, idle_probabilities.tolist()
+                    )
+                )
+
+            results = {
+                int(room_id): PredictionResponse(
+                    idle_probability=idle_probability,
+                    confidence_score=confidence_score,
+                ).to_dict()
+                for room_id, idle_probability, confidence_score in zip(
+                    room_ids,
+                    idle_probabilities.tolist(),
+                    confidence_scores.tolist(),
+                )
+            }
+            logger.info(
+                "Prediction batch inference completed | rooms=%s | date=%s | time_slot=%s",
+                len(room_ids),
+                date,
+                time_slot,
+            )
+            return results
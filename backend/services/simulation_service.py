@@ -13,7 +13,11 @@ from dataclasses import dataclass, replace
 from typing import Optional
 from uuid import uuid4
 
-from backend.domain.constraints import AllocationConfig, validate_allocation_config
+from backend.domain.constraints import (
+    AllocationConfig,
+    allocation_config_from,
+    validate_allocation_config,
+)
 from backend.domain.models import AllocationDecision, AllocationRequest, IdlePrediction, Room
 from backend.repository.data_repository import DataRepository
 from backend.services.matching_service import (
@@ -116,20 +120,20 @@ class SimulationService:
         idle_threshold: Optional[float] = None,
         stakeholder_cap: Optional[float] = None,
     ) -> AllocationConfig:
-        config = AllocationConfig(
+        base = allocation_config_from(self._settings)
+        config = replace(
+            base,
             idle_probability_threshold=(
                 idle_threshold
                 if idle_threshold is not None
-                else self._settings.allocation_idle_probability_threshold
+                else base.idle_probability_threshold
             ),
             stakeholder_usage_cap=(
                 stakeholder_cap
                 if stakeholder_cap is not None
-                else self._settings.allocation_stakeholder_usage_cap
+                else base.stakeholder_usage_cap
             ),
-            solver_max_time_seconds=self._settings.allocation_solver_max_time_seconds,
             solver_random_seed=self._settings.simulation_solver_random_seed,
-            objective_scale=self._settings.allocation_objective_scale,
             cp_sat_workers=self._settings.simulation_cp_sat_workers,
         )
         validate_allocation_config(config)
@@ -38,6 +38,14 @@ def _env_float(name: str, default: float) -> float:
         return default
 
 
+def _env_bool(name: str, default: bool) -> bool:
+    """Parse boolean environment flags with sensible defaults."""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
 def _env_csv(name: str, default: Tuple[str, ...]) -> Tuple[str, ...]:
     """Allow slot configuration via comma-separated env var."""
     value = os.getenv(name)
@@ -58,7 +66,10 @@ class Settings:
     app_name: str
     app_version: str
     log_level: str
+    enable_openapi: bool
     database_path: Path
+    db_pool_min_connections: int
+    db_pool_max_connections: int
     synthetic_dataset_filename: str
 
     synthetic_seed_days: int
@@ -75,6 +86,7 @@ class Settings:
     prediction_default_occupancy_probability: float
     prediction_time_slot_regex: str
     prediction_model_version: str
+    prediction_model_cache_path: Path
 
     allocation_idle_probability_threshold: float
     allocation_stakeholder_usage_cap: float
@@ -83,11 +95,27 @@ class Settings:
     allocation_objective_scale: int
     allocation_cp_sat_workers: int
     allocation_forecast_history_days: int
+    allocation_use_warm_start: bool
+    allocation_async_persist: bool
     simulation_cp_sat_workers: int
     simulation_solver_random_seed: int
+    startup_timeout: float
     admin_token: str
 
 
+def get_time_slot_regex() -> str:
+    """Read the time-slot pattern without building the full Settings object.
+
+    Controllers need this single value at import time for model field
+    patterns; going through :func:`get_settings` there would pull the whole
+    settings graph (including the data-directory mkdir) into module import.
+    """
+    return os.getenv(
+        "PREDICTION_TIME_SLOT_REGEX",
+        r"^([01]\d|2[0-3])-([01]\d|2[0-3])$",
+    )
+
+
 @lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Load and cache runtime settings once for process lifetime."""
@@ -99,7 +127,10 @@ def get_settings() -> Settings:
         app_name=os.getenv("APP_NAME", "SIET API"),
         app_version=os.getenv("APP_VERSION", "1.0.0"),
         log_level=os.getenv("LOG_LEVEL", "INFO"),
+        enable_openapi=_env_bool("ENABLE_OPENAPI", True),
         database_path=data_dir / os.getenv("DATABASE_FILENAME", "siet.db"),
+        db_pool_min_connections=_env_int("DB_POOL_MIN_CONNECTIONS", 2),
+        db_pool_max_connections=_env_int("DB_POOL_MAX_CONNECTIONS", 8),
         synthetic_dataset_filename=os.getenv(
             "SYNTHETIC_DATASET_FILENAME",
             "synthetic_dataset.csv",
@@ -130,14 +161,15 @@ def get_settings() -> Settings:
             "PREDICTION_DEFAULT_OCCUPANCY_PROBABILITY",
             0.5,
         ),
-        prediction_time_slot_regex=os.getenv(
-            "PREDICTION_TIME_SLOT_REGEX",
-            r"^([01]\d|2[0-3])-([01]\d|2[0-3])$",
-        ),
+        prediction_time_slot_regex=get_time_slot_regex(),
         prediction_model_version=os.getenv(
             "PREDICTION_MODEL_VERSION",
             "idle_logreg_v1",
         ),
+        prediction_model_cache_path=data_dir / os.getenv(
+            "PREDICTION_MODEL_CACHE_FILENAME",
+            "idle_model_cache.joblib",
+        ),
         allocation_idle_probability_threshold=_env_float(
             "ALLOCATION_IDLE_PROBABILITY_THRESHOLD",
             0.25,
@@ -157,7 +189,16 @@ def get_settings() -> Settings:
             "ALLOCATION_FORECAST_HISTORY_DAYS",
             30,
         ),
+        # Off by default: warm-start hints help incremental re-solves but can
+        # mislead search when the request set changes shape between runs.
+        allocation_use_warm_start=_env_bool("ALLOCATION_USE_WARM_START", False),
+        # Off by default: approve responses then only return after forecasts,
+        # logs, and status flips are committed. Enabling moves that write
+        # behind a single background writer for faster responses at the cost
+        # of a small durability window.
+        allocation_async_persist=_env_bool("ALLOCATION_ASYNC_PERSIST", False),
         simulation_cp_sat_workers=_env_int("SIMULATION_CP_SAT_WORKERS", 1),
         simulation_solver_random_seed=_env_int("SIMULATION_SOLVER_RANDOM_SEED", 42),
+        startup_timeout=_env_float("STARTUP_TIMEOUT_SECONDS", 30.0),
         admin_token=os.getenv("ADMIN_TOKEN", "admin-token").strip(),
     )
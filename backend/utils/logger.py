@@ -37,6 +37,12 @@ def configure_logging(level: Optional[str] = None) -> None:
 
 
 def get_logger(name: str) -> logging.Logger:
-    """Return a configured logger for the requested module."""
-    configure_logging()
+    """Return a logger for the requested module.
+
+    Deliberately does NOT configure logging: modules call this at import
+    time, and configuring here would pull the full settings graph (env
+    parsing, data-directory creation) into every import. ``create_app``
+    calls :func:`configure_logging` once when the application is built;
+    until then loggers fall back to Python's last-resort stderr handler.
+    """
     return logging.getLogger(name)
@@ -0,0 +1,28 @@
+"""orjson-backed response class for the application factory.
+
+FastAPI deprecated its bundled ``ORJSONResponse`` in favour of
+pydantic-serialized routes, but the dashboard endpoints return plain
+dicts/lists built via ``model_construct`` and TypeAdapters, so the
+response renderer still runs on every hit. Owning the class keeps the
+orjson options explicit: NumPy scalars/arrays serialize without a
+``default=`` callback and non-string keys (int room ids in maps) are
+allowed.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered by orjson in one C-level pass."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=_ORJSON_OPTIONS)
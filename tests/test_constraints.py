@@ -88,9 +88,8 @@ def test_objective_scale_negative_raises() -> None:
 
 # --- cp_sat_workers ---
 
-def test_cp_sat_workers_zero_raises() -> None:
-    with pytest.raises(ValueError):
-        validate_allocation_config(valid_config(cp_sat_workers=0))
+def test_cp_sat_workers_zero_means_auto() -> None:
+    validate_allocation_config(valid_config(cp_sat_workers=0))
 
 
 def test_cp_sat_workers_negative_raises() -> None:
@@ -10,9 +10,13 @@ pytest.importorskip("ortools")
 
 from backend.controllers.allocation_controller import router as allocation_router
 from backend.controllers.dashboard_controller import router as dashboard_router
+from backend.controllers.error_handlers import register_exception_handlers
 from backend.repository.data_repository import DataRepository
 from backend.services.auth_service import AuthService
-from backend.services.dashboard_service import DashboardWorkflowService
+from backend.services.dashboard_service import (
+    AllocationDraftNotFoundError,
+    DashboardWorkflowService,
+)
 from backend.services.matching_service import AllocationOptimizationService
 from backend.services.prediction_service import AvailabilityPredictionService
 from backend.services.simulation_service import SimulationService
@@ -62,6 +66,7 @@ def _build_test_app(tmp_path, admin_token: str) -> tuple[FastAPI, DataRepository
     )
 
     app = FastAPI()
+    register_exception_handlers(app)
     app.include_router(allocation_router)
     app.include_router(dashboard_router)
     app.state.repository = repository
@@ -161,3 +166,39 @@ def test_login_rejects_invalid_admin_token(tmp_path):
     client = TestClient(app)
     response = client.post("/login", json={"admin_token": "wrong-token"})
     assert response.status_code == 401
+
+
+def test_approve_reuses_preview_draft_without_second_solve(tmp_path, monkeypatch):
+    app, repository = _build_test_app(tmp_path, "secret-admin-token")
+    dashboard_service = app.state.dashboard_service
+    matching_service = app.state.matching_service
+
+    target_date = "2026-03-01"
+    target_slot = "11-13"
+    repository.create_request(14, target_date, target_slot, 1.2, "dept_a")
+    repository.create_request(20, target_date, target_slot, 1.0, "dept_b")
+
+    preview = dashboard_service.preview_allocation(
+        requested_date=target_date,
+        requested_time_slot=target_slot,
+        idle_probability_threshold=0.5,
+        stakeholder_usage_cap=0.7,
+    )
+    before_logs = repository.count_allocation_logs()
+
+    def _must_not_resolve(*args, **kwargs):
+        raise AssertionError("approve must persist the cached preview, not re-solve")
+
+    monkeypatch.setattr(matching_service, "optimize_allocation", _must_not_resolve)
+
+    approved = dashboard_service.approve_latest_allocation()
+
+    assert approved["status"] == "APPROVED"
+    assert approved["objective_value"] == pytest.approx(preview["objective_value"])
+    assert (
+        repository.count_allocation_logs()
+        == before_logs + approved["approved_allocations_count"]
+    )
+    # The draft is consumed on approval; a second approve has nothing to persist.
+    with pytest.raises(AllocationDraftNotFoundError):
+        dashboard_service.approve_latest_allocation()
@@ -10,6 +10,7 @@ pytest.importorskip("ortools")
 
 from backend.controllers.allocation_controller import router
 from backend.controllers.dashboard_controller import router as dashboard_router
+from backend.controllers.error_handlers import register_exception_handlers
 from backend.repository.data_repository import DataRepository
 from backend.services.auth_service import AuthService
 from backend.services.matching_service import AllocationOptimizationService
@@ -127,6 +128,7 @@ def test_optimize_allocation_endpoint_success(tmp_path):
 
     service = AllocationOptimizationService(repository=repository, settings=settings)
     app = FastAPI()
+    register_exception_handlers(app)
     app.include_router(router)
     app.include_router(dashboard_router)
     app.state.matching_service = service
@@ -153,3 +155,100 @@ def test_optimize_allocation_endpoint_success(tmp_path):
     assert "fairness_metric" in body
     assert body["objective_value"] >= 0.0
     assert 0.0 <= body["fairness_metric"] <= 1.0
+
+
+def test_assignment_shortcut_matches_cp_sat_objective():
+    pytest.importorskip("scipy")
+    from backend.domain.constraints import AllocationConfig
+    from backend.domain.models import AllocationRequest, IdlePrediction, Room
+    from backend.services.matching_service import (
+        assignment_shortcut_allocate,
+        build_model,
+        solve_model,
+    )
+
+    target_date = "2026-02-23"
+    target_slot = "09-11"
+    rooms = [Room(room_id=room_id, capacity=10 * room_id) for room_id in range(1, 7)]
+    predictions = [
+        IdlePrediction(
+            room_id=room.room_id,
+            date=target_date,
+            time_slot=target_slot,
+            idle_probability=0.3 + 0.1 * room.room_id,
+        )
+        for room in rooms
+    ]
+    requests = [
+        AllocationRequest(1, 15, target_date, target_slot, 2.0, "dept_a"),
+        AllocationRequest(2, 25, target_date, target_slot, 1.5, "dept_a"),
+        AllocationRequest(3, 40, target_date, target_slot, 1.0, "dept_b"),
+        AllocationRequest(4, 999, target_date, target_slot, 3.0, "dept_c"),
+    ]
+    config = AllocationConfig(
+        idle_probability_threshold=0.45,
+        stakeholder_usage_cap=1.0,
+        solver_max_time_seconds=5,
+        solver_random_seed=42,
+        objective_scale=1000,
+        cp_sat_workers=2,
+    )
+
+    shortcut = assignment_shortcut_allocate(
+        rooms=rooms,
+        requests=requests,
+        predictions=predictions,
+        config=config,
+    )
+    artifacts = build_model(
+        rooms=rooms,
+        requests=requests,
+        predictions=predictions,
+        config=config,
+    )
+    cp_sat = solve_model(
+        artifacts=artifacts,
+        rooms=rooms,
+        requests=requests,
+        predictions=predictions,
+        config=config,
+    )
+
+    assert shortcut.objective_value == pytest.approx(cp_sat.objective_value)
+    assert set(shortcut.unassigned_request_ids) == set(cp_sat.unassigned_request_ids)
+    assert 4 in shortcut.unassigned_request_ids
+    assert len(shortcut.allocations) == len(cp_sat.allocations)
+
+
+def test_async_persist_queue_flushes_outputs(tmp_path):
+    settings = replace(
+        _build_test_settings(tmp_path, "matching_async.db"),
+        allocation_async_persist=True,
+    )
+    repository = DataRepository(settings)
+    repository.initialize_database()
+    repository.seed_synthetic_data()
+
+    target_date = "2026-02-25"
+    target_slot = "16-18"
+    _seed_predictions(repository, target_date, target_slot)
+    request_ids = [
+        repository.create_request(12, target_date, target_slot, 1.3, "dept_a"),
+        repository.create_request(20, target_date, target_slot, 1.0, "dept_b"),
+    ]
+
+    service = AllocationOptimizationService(repository=repository, settings=settings)
+    result = service.optimize_allocation(
+        requested_date=target_date,
+        requested_time_slot=target_slot,
+    )
+    # With the background writer enabled the outputs are only guaranteed on
+    # disk once the queue has drained.
+    service.flush_pending_persists()
+
+    assert repository.count_allocation_logs() == len(result.allocations)
+    assert repository.count_forecast_logs() >= 1
+    allocated_ids = {item.request_id for item in result.allocations}
+    for request_id in request_ids:
+        expected = "ALLOCATED" if request_id in allocated_ids else "PENDING"
+        assert repository.get_request_status(request_id) == expected
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import csv
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import replace
 
 from backend.repository.data_repository import DataRepository
@@ -96,3 +97,39 @@ def test_seed_demo_requests_if_empty_is_idempotent(tmp_path):
 
     pending_windows = repository.list_pending_request_windows()
     assert pending_windows
+
+
+def test_create_request_bumps_pending_requests_version(tmp_path):
+    settings = _build_test_settings(tmp_path, "request_version.db")
+    repository = DataRepository(settings)
+    repository.initialize_database()
+
+    version_before = repository.pending_requests_version
+    created_id = repository.create_request(10, "2026-03-02", "09-11", 1.0, "dept_a")
+
+    assert created_id > 0
+    assert repository.pending_requests_version > version_before
+
+
+def test_connection_pool_bounds_connections_under_concurrency(tmp_path):
+    settings = replace(
+        _build_test_settings(tmp_path, "pool_test.db"),
+        db_pool_min_connections=1,
+        db_pool_max_connections=3,
+    )
+    repository = DataRepository(settings)
+    repository.initialize_database()
+    repository.seed_synthetic_data()
+
+    expected_rooms = len(repository.list_rooms_for_allocation())
+
+    def _read() -> int:
+        return len(repository.list_rooms_for_allocation())
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = [future.result() for future in [executor.submit(_read) for _ in range(40)]]
+
+    assert all(count == expected_rooms for count in results)
+    # Every borrow beyond the warm minimum is created lazily and returned to
+    # the pool; concurrency never opens more than the configured maximum.
+    assert repository._pool_connections_created <= 3
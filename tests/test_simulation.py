@@ -10,6 +10,7 @@ pytest.importorskip("ortools")
 
 from backend.controllers.allocation_controller import router
 from backend.controllers.dashboard_controller import router as dashboard_router
+from backend.controllers.error_handlers import register_exception_handlers
 from backend.repository.data_repository import DataRepository
 from backend.services.auth_service import AuthService
 from backend.services.prediction_service import AvailabilityPredictionService
@@ -145,6 +146,7 @@ def test_simulate_endpoint_validates_unknown_capacity_override_room(tmp_path):
     simulation_service = _build_simulation_service(repository, settings)
 
     app = FastAPI()
+    register_exception_handlers(app)
     app.include_router(router)
     app.include_router(dashboard_router)
     app.state.repository = repository
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import pytest
+
+from backend.domain.timekeys import (
+    date_to_days,
+    days_to_date,
+    pack_time_key,
+    slot_to_index,
+)
+
+
+def test_date_to_days_round_trips():
+    assert days_to_date(date_to_days("2026-02-23")) == "2026-02-23"
+    with pytest.raises(ValueError):
+        date_to_days("2026-13-40")
+
+
+def test_slot_to_index_accepts_padded_and_unpadded_hours():
+    assert slot_to_index("09-11") == 9
+    assert slot_to_index("9-11") == 9
+    assert slot_to_index("23-01") == 23
+    with pytest.raises(ValueError):
+        slot_to_index("24-26")
+    with pytest.raises(ValueError):
+        slot_to_index("morning")
+
+
+def test_pack_time_key_is_unique_per_date_and_slot():
+    key = pack_time_key("2026-02-23", "09-11")
+    assert key == (date_to_days("2026-02-23") << 8) | 9
+    assert pack_time_key("2026-02-23", "9-11") == key
+    assert pack_time_key("2026-02-23", "11-13") != key
+    assert pack_time_key("2026-02-24", "09-11") != key